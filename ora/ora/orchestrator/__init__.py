@@ -2,11 +2,19 @@
 OrA Orchestrator - Multi-agent routing and approval workflow management
 """
 
-from .graph import OraOrchestrator, AgentState, AgentAction, route_to_specialist, check_requires_approval
+from .graph import (
+    OraOrchestrator,
+    OrchestratorResult,
+    AgentState,
+    AgentAction,
+    route_to_specialist,
+    check_requires_approval,
+)
 from .service import OrchestratorService, PendingApproval
 
 __all__ = [
     "OraOrchestrator",
+    "OrchestratorResult",
     "AgentState",
     "AgentAction",
     "route_to_specialist",
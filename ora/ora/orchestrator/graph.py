@@ -1,25 +1,16 @@
 """ora.orchestrator.graph - Multi-agent orchestration with specialist routing and real agent execution."""
 
-from typing import TypedDict, Annotated, Literal, List, Dict, Any
+from typing import TypedDict, Annotated, Literal, List, Dict, Any, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 import operator
 import logging
-
-from ora.agents.planner import PlannerAgent
-from ora.agents.researcher import ResearcherAgent
-from ora.agents.builder import BuilderAgent
-from ora.agents.tester import TesterAgent
-from ora.agents.integrator import IntegratorAgent
-from ora.agents.security_agent import SecurityAgent
-from ora.agents.selfdev import SelfDevAgent
-from ora.agents.fleet import AgentFleet
-from ora.core.constitution import Operation
-from ora.core.authority import AuthorityLevel
+import re
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentAction:
     """Proposed action requiring potential approval."""
     agent: str
@@ -35,38 +26,180 @@ class AgentState(TypedDict):
     """State passed through the agent graph."""
     messages: Annotated[List[Dict[str, str]], operator.add]
     user_query: str
+    user_query_lower: str
     current_agent: str
     specialist_response: str
     requires_approval: bool
     approved: bool
-    pending_action: Dict[str, Any]
+    pending_action: Optional[AgentAction]
+
+
+@dataclass(slots=True)
+class OrchestratorResult:
+    """Outcome of running one query through a specialist."""
+    agent: str
+    requires_approval: bool
+    pending_action: Optional[AgentAction]
+    response: str
+    next_step: str
+    state: AgentState = field(repr=False)
 
 
 # Keywords for routing to specialists (matching our actual agents)
 ROUTING_KEYWORDS = {
-    "planner": ["plan", "strategy", "roadmap", "design", "architecture", "approach", "breakdown", "decompose", "task"],
-    "researcher": ["research", "find", "search", "lookup", "what is", "how to", "explain", "documentation", "information", "web", "internet"],
-    "builder": ["write", "create", "modify", "edit", "update", "save", "generate", "code", "implement", "refactor", "function", "class", "python", "javascript", "typescript"],
-    "tester": ["test", "validate", "verify", "quality", "assurance", "check", "lint", "type", "debug", "bug", "error"],
-    "integrator": ["deploy", "merge", "integrate", "orchestrate", "rollback", "health", "system", "monitor", "process", "restart"],
-    "security": ["security", "scan", "vulnerability", "audit", "password", "secret", "encrypt", "permission", "threat", "risk", "malware"],
-    "selfdev": ["self", "improve", "analyze", "backup", "suggestion", "todo", "fixme", "refactor", "enhance", "optimize", "codebase", "ora"],
+    "planner": ("plan", "strategy", "roadmap", "design", "architecture", "approach", "breakdown", "decompose", "task"),
+    "researcher": ("research", "find", "search", "lookup", "what is", "how to", "explain", "documentation", "information", "web", "internet"),
+    "builder": ("write", "create", "modify", "edit", "update", "save", "generate", "code", "implement", "refactor", "function", "class", "python", "javascript", "typescript"),
+    "tester": ("test", "validate", "verify", "quality", "assurance", "check", "lint", "type", "debug", "bug", "error"),
+    "integrator": ("deploy", "merge", "integrate", "orchestrate", "rollback", "health", "system", "monitor", "process", "restart"),
+    "security": ("security", "scan", "vulnerability", "audit", "password", "secret", "encrypt", "permission", "threat", "risk", "malware"),
+    "selfdev": ("self", "improve", "analyze", "backup", "suggestion", "todo", "fixme", "refactor", "enhance", "optimize", "codebase", "ora"),
 }
 
+SPECIALIST_NAMES = tuple(ROUTING_KEYWORDS)
+
+# Keyword matcher built once at import: each distinct keyword maps to the index
+# of every specialist listing it, so keywords shared between specialists are scanned once
+_KEYWORD_MATCHER = tuple(
+    (keyword, tuple(i for i, kws in enumerate(ROUTING_KEYWORDS.values()) if keyword in kws))
+    for keyword in dict.fromkeys(kw for kws in ROUTING_KEYWORDS.values() for kw in kws)
+)
+
+
+def _build_keyword_automaton():
+    """
+    Compile _KEYWORD_MATCHER into an Aho-Corasick automaton.
+    
+    Returns None when pyahocorasick (the "perf" extra) isn't installed, in
+    which case routing tests each keyword with a substring search instead.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, specialist_ids in _KEYWORD_MATCHER:
+        automaton.add_word(keyword, (keyword, specialist_ids))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Queries longer than this (pasted logs, code blocks) are routed without memoization
+ROUTE_CACHE_MAX_QUERY_LEN = 2048
+
 # Operations that require human approval
-DANGEROUS_OPERATIONS = [
+DANGEROUS_OPERATIONS = (
     "delete", "remove", "kill", "terminate", "modify", "write", "execute",
     "install", "uninstall", "format", "overwrite", "sudo", "admin",
     "drop", "truncate", "rm", "mkfs", "chmod", "chown",
-]
+)
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_OPERATIONS)))
+
+# Per-agent keywords that escalate an operation to human approval
+_INTEGRATOR_APPROVAL_RE = re.compile(r"deploy|merge|rollback|system|exec")
+_SECURITY_APPROVAL_RE = re.compile(r"fix|patch|modify|change|remediate")
 
 
+def _compile_skill_rules(*rules: tuple) -> "re.Pattern[str]":
+    """
+    Compile ordered (skill, keywords) rules into one anchored regex.
+    
+    Each rule is a lookahead from the start of the text, so the first rule
+    with any keyword present wins regardless of where it appears, and
+    match.lastgroup names the skill.
+    """
+    return re.compile(
+        "|".join(
+            f"^(?=.*?(?P<{skill}>{'|'.join(map(re.escape, keywords))}))"
+            for skill, keywords in rules
+        ),
+        re.DOTALL,
+    )
+
+
+_BUILDER_SKILL_RE = _compile_skill_rules(
+    ("code_generation", ("code", "generate")),
+    ("refactor", ("refactor",)),
+)
+_INTEGRATOR_SKILL_RE = _compile_skill_rules(
+    ("deploy", ("deploy",)),
+    ("merge", ("merge",)),
+    ("rollback", ("rollback",)),
+)
+_SECURITY_SKILL_RE = _compile_skill_rules(
+    ("audit_review", ("audit",)),
+    ("threat_detection", ("threat",)),
+    ("vulnerability_assessment", ("vulnerability",)),
+)
+_SELFDEV_SKILL_RE = _compile_skill_rules(
+    ("self_propose", ("propose", "change")),
+    ("self_backup", ("backup",)),
+    ("self_improve", ("improve", "suggestion")),
+)
+
+# Per-specialist (description label, operation, parameters key) for pending actions
+AGENT_META = {
+    "planner": ("Planner Agent", "strategic_planning", "task"),
+    "researcher": ("Researcher Agent", "information_retrieval", "query"),
+    "builder": ("Builder Agent", "file_operation", "task"),
+    "tester": ("Tester Agent", "quality_assurance", "test_target"),
+    "integrator": ("Integrator Agent", "system_integration", "task"),
+    "security": ("Security Agent", "security_operation", "target"),
+    "selfdev": ("Self-Dev Agent", "self_development", "task"),
+}
+
+
+def _score_specialists(query_lower: str) -> str:
+    """
+    Pick the specialist whose keywords best match an already-lowercased query.
+    
+    With pyahocorasick installed, one automaton pass finds every keyword;
+    otherwise each keyword is tested with a plain substring search.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        # A keyword found several times still counts once
+        matched = {
+            keyword: specialist_ids
+            for _, (keyword, specialist_ids) in _KEYWORD_AUTOMATON.iter(query_lower)
+        }.values()
+    else:
+        matched = [
+            specialist_ids
+            for keyword, specialist_ids in _KEYWORD_MATCHER
+            if keyword in query_lower
+        ]
+    
+    # Count keyword matches per specialist
+    scores = [0] * len(SPECIALIST_NAMES)
+    for specialist_ids in matched:
+        for i in specialist_ids:
+            scores[i] += 1
+    
+    # Find highest scoring specialist (first one wins ties)
+    best_idx = 0
+    best_score = scores[0]
+    for i in range(1, len(scores)):
+        score = scores[i]
+        if score > best_score:
+            best_idx = i
+            best_score = score
+    
+    # Default to researcher if no matches
+    if best_score == 0:
+        return "researcher"
+    
+    return SPECIALIST_NAMES[best_idx]
+
+
+@lru_cache(maxsize=1024)
 def route_to_specialist(query: str) -> Literal["planner", "researcher", "builder", "tester", "integrator", "security", "selfdev"]:
     """
     Route user query to the appropriate specialist agent.
     
-    Uses keyword matching for fast routing. Can be enhanced with
-    semantic routing via embeddings in the future.
+    Uses keyword matching for fast routing, memoized per query. Can be
+    enhanced with semantic routing via embeddings in the future.
     
     Args:
         query: The user query to route
@@ -74,26 +207,10 @@ def route_to_specialist(query: str) -> Literal["planner", "researcher", "builder
     Returns:
         Specialist agent name
     """
-    query_lower = query.lower()
-    
-    # Count keyword matches per specialist
-    scores = {specialist: 0 for specialist in ROUTING_KEYWORDS}
-    
-    for specialist, keywords in ROUTING_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query_lower:
-                scores[specialist] += 1
-    
-    # Find highest scoring specialist
-    best_specialist = max(scores, key=scores.get)
-    
-    # Default to researcher if no matches
-    if scores[best_specialist] == 0:
-        return "researcher"
-    
-    return best_specialist
+    return _score_specialists(query.lower())
 
 
+@lru_cache(maxsize=1024)
 def check_requires_approval(query: str, operation: str = "") -> bool:
     """
     Check if an operation requires human approval.
@@ -106,12 +223,35 @@ def check_requires_approval(query: str, operation: str = "") -> bool:
         True if approval is required
     """
     combined = f"{query} {operation}".lower()
-    
-    for dangerous_word in DANGEROUS_OPERATIONS:
-        if dangerous_word in combined:
-            return True
-    
-    return False
+    return _DANGEROUS_RE.search(combined) is not None
+
+
+def _query_lower(state: AgentState) -> str:
+    """Lowercased user query, computed once per state."""
+    query_lower = state.get("user_query_lower")
+    if query_lower is None:
+        query_lower = state["user_query_lower"] = state["user_query"].lower()
+    return query_lower
+
+
+def _make_action(
+    agent: str,
+    query: str,
+    skill: str,
+    authority_required: str,
+    is_dangerous: bool = False,
+) -> AgentAction:
+    """Build the pending action for a specialist from its AGENT_META entry."""
+    label, operation, parameter = AGENT_META[agent]
+    return AgentAction(
+        agent=agent,
+        operation=operation,
+        description=f"{label}: {query[:100]}",
+        is_dangerous=is_dangerous,
+        authority_required=authority_required,
+        skill=skill,
+        parameters={parameter: query},
+    )
 
 
 def planner_agent(state: AgentState) -> AgentState:
@@ -130,14 +270,7 @@ def planner_agent(state: AgentState) -> AgentState:
     query = state["user_query"]
     skill = "planning"
     
-    state["pending_action"] = {
-        "agent": "planner",
-        "operation": "strategic_planning",
-        "description": f"Planner Agent: {query[:100]}",
-        "authority_required": "A3",
-        "skill": skill,
-        "parameters": {"task": query},
-    }
+    state["pending_action"] = _make_action("planner", query, skill, "A3")
     
     return state
 
@@ -157,14 +290,7 @@ def researcher_agent(state: AgentState) -> AgentState:
     query = state["user_query"]
     skill = "web_search"
     
-    state["pending_action"] = {
-        "agent": "researcher",
-        "operation": "information_retrieval",
-        "description": f"Researcher Agent: {query[:100]}",
-        "authority_required": "A2",
-        "skill": skill,
-        "parameters": {"query": query},
-    }
+    state["pending_action"] = _make_action("researcher", query, skill, "A2")
     
     return state
 
@@ -184,21 +310,10 @@ def builder_agent(state: AgentState) -> AgentState:
     query = state["user_query"]
     
     # Determine skill based on query
-    skill = "file_write"
-    if "code" in query.lower() or "generate" in query.lower():
-        skill = "code_generation"
-    elif "refactor" in query.lower():
-        skill = "refactor"
-    
-    state["pending_action"] = {
-        "agent": "builder",
-        "operation": "file_operation",
-        "description": f"Builder Agent: {query[:100]}",
-        "is_dangerous": True,
-        "authority_required": "A4",
-        "skill": skill,
-        "parameters": {"task": query},
-    }
+    match = _BUILDER_SKILL_RE.search(_query_lower(state))
+    skill = match.lastgroup if match else "file_write"
+    
+    state["pending_action"] = _make_action("builder", query, skill, "A4", is_dangerous=True)
     
     return state
 
@@ -218,14 +333,7 @@ def tester_agent(state: AgentState) -> AgentState:
     query = state["user_query"]
     skill = "test_execution"
     
-    state["pending_action"] = {
-        "agent": "tester",
-        "operation": "quality_assurance",
-        "description": f"Tester Agent: {query[:100]}",
-        "authority_required": "A1",
-        "skill": skill,
-        "parameters": {"test_target": query},
-    }
+    state["pending_action"] = _make_action("tester", query, skill, "A1")
     
     return state
 
@@ -241,27 +349,19 @@ def integrator_agent(state: AgentState) -> AgentState:
     
     # Integration operations require approval
     query = state["user_query"]
-    requires_approval = any(kw in query.lower() for kw in ["deploy", "merge", "rollback", "system", "exec"])
+    query_lower = _query_lower(state)
+    requires_approval = _INTEGRATOR_APPROVAL_RE.search(query_lower) is not None
     
     state["requires_approval"] = requires_approval
     
-    skill = "integration"
-    if "deploy" in query.lower():
-        skill = "deploy"
-    elif "merge" in query.lower():
-        skill = "merge"
-    elif "rollback" in query.lower():
-        skill = "rollback"
-    
-    state["pending_action"] = {
-        "agent": "integrator",
-        "operation": "system_integration",
-        "description": f"Integrator Agent: {query[:100]}",
-        "is_dangerous": requires_approval,
-        "authority_required": "A4" if requires_approval else "A3",
-        "skill": skill,
-        "parameters": {"task": query},
-    }
+    match = _INTEGRATOR_SKILL_RE.search(query_lower)
+    skill = match.lastgroup if match else "integration"
+    
+    state["pending_action"] = _make_action(
+        "integrator", query, skill,
+        "A4" if requires_approval else "A3",
+        is_dangerous=requires_approval,
+    )
     
     return state
 
@@ -277,27 +377,20 @@ def security_agent(state: AgentState) -> AgentState:
     
     query = state["user_query"]
     
+    query_lower = _query_lower(state)
+    
     # Security scans are safe, remediation requires approval
-    requires_approval = any(kw in query.lower() for kw in ["fix", "patch", "modify", "change", "remediate"])
+    requires_approval = _SECURITY_APPROVAL_RE.search(query_lower) is not None
     
     state["requires_approval"] = requires_approval
     
-    skill = "security_scan"
-    if "audit" in query.lower():
-        skill = "audit_review"
-    elif "threat" in query.lower():
-        skill = "threat_detection"
-    elif "vulnerability" in query.lower():
-        skill = "vulnerability_assessment"
-    
-    state["pending_action"] = {
-        "agent": "security",
-        "operation": "security_operation",
-        "description": f"Security Agent: {query[:100]}",
-        "authority_required": "A4" if requires_approval else "A3",
-        "skill": skill,
-        "parameters": {"target": query},
-    }
+    match = _SECURITY_SKILL_RE.search(query_lower)
+    skill = match.lastgroup if match else "security_scan"
+    
+    state["pending_action"] = _make_action(
+        "security", query, skill,
+        "A4" if requires_approval else "A3",
+    )
     
     return state
 
@@ -316,23 +409,10 @@ def selfdev_agent(state: AgentState) -> AgentState:
     # Self-dev operations always require human approval
     state["requires_approval"] = True
     
-    skill = "self_analyze"
-    if "propose" in query.lower() or "change" in query.lower():
-        skill = "self_propose"
-    elif "backup" in query.lower():
-        skill = "self_backup"
-    elif "improve" in query.lower() or "suggestion" in query.lower():
-        skill = "self_improve"
-    
-    state["pending_action"] = {
-        "agent": "selfdev",
-        "operation": "self_development",
-        "description": f"Self-Dev Agent: {query[:100]}",
-        "is_dangerous": True,
-        "authority_required": "A4",
-        "skill": skill,
-        "parameters": {"task": query},
-    }
+    match = _SELFDEV_SKILL_RE.search(_query_lower(state))
+    skill = match.lastgroup if match else "self_analyze"
+    
+    state["pending_action"] = _make_action("selfdev", query, skill, "A4", is_dangerous=True)
     
     return state
 
@@ -357,27 +437,29 @@ def approval_gate(state: AgentState) -> Literal["execute", "await_approval", "di
 
 def execute_action(state: AgentState) -> AgentState:
     """Execute the approved action."""
-    action = state.get("pending_action", {})
-    state["specialist_response"] = f"✓ Executed: {action.get('operation', 'action')}"
+    action = state.get("pending_action")
+    state["specialist_response"] = f"✓ Executed: {action.operation if action else 'action'}"
     return state
 
 
+# Canned replies for specialists that answer without executing anything
+DIRECT_RESPONSES = {
+    "planner": "I can help you plan and strategize. Let me understand your goals and break down the task.",
+    "researcher": "Let me research that for you. I'll search for relevant information and documentation.",
+    "builder": "I can help create or modify code/files. This will require your approval before execution.",
+    "tester": "I can help test and validate that. Let me run quality checks and verification.",
+    "integrator": "I can help with deployment and integration. Some operations may require approval.",
+    "security": "I'll analyze that from a security perspective and check for vulnerabilities.",
+    "selfdev": "I can help improve OrA's own codebase. All changes require your approval.",
+}
+
+
 def generate_response(state: AgentState) -> AgentState:
     """Generate final response without execution."""
-    action = state.get("pending_action", {})
-    agent = action.get("agent", "unknown")
-    
-    responses = {
-        "planner": "I can help you plan and strategize. Let me understand your goals and break down the task.",
-        "researcher": "Let me research that for you. I'll search for relevant information and documentation.",
-        "builder": "I can help create or modify code/files. This will require your approval before execution.",
-        "tester": "I can help test and validate that. Let me run quality checks and verification.",
-        "integrator": "I can help with deployment and integration. Some operations may require approval.",
-        "security": "I'll analyze that from a security perspective and check for vulnerabilities.",
-        "selfdev": "I can help improve OrA's own codebase. All changes require your approval.",
-    }
-    
-    state["specialist_response"] = responses.get(agent, "How can I help?")
+    action = state.get("pending_action")
+    agent = action.agent if action else "unknown"
+    
+    state["specialist_response"] = DIRECT_RESPONSES.get(agent, "How can I help?")
     return state
 
 
@@ -407,29 +489,36 @@ class OraOrchestrator:
     def __init__(self):
         self.agents = AGENT_NODES
     
-    def process_query(self, query: str) -> Dict[str, Any]:
+    def process_query(self, query: str, specialist: Optional[str] = None) -> OrchestratorResult:
         """
         Process a user query through the orchestrator.
         
         Args:
             query: The user query to process
+            specialist: Specialist already chosen for this query (skips routing)
             
         Returns:
-            Dict with agent, requires_approval, pending_action, response, next_step
+            OrchestratorResult with the agent's final state
         """
         # Initialize state
         state: AgentState = {
             "messages": [],
             "user_query": query,
+            "user_query_lower": query.lower(),
             "current_agent": "",
             "specialist_response": "",
             "requires_approval": False,
             "approved": False,
-            "pending_action": {},
+            "pending_action": None,
         }
         
-        # Route to specialist
-        specialist = route_to_specialist(query)
+        # Route to specialist; long pastes are one-offs, so score them directly
+        # from the lowered query instead of pinning them in the routing cache
+        if specialist is None:
+            if len(query) > ROUTE_CACHE_MAX_QUERY_LEN:
+                specialist = _score_specialists(state["user_query_lower"])
+            else:
+                specialist = route_to_specialist(query)
         
         # Run specialist agent
         agent_fn = self.agents.get(specialist, researcher_agent)
@@ -442,20 +531,23 @@ class OraOrchestrator:
         if next_step == "direct_response":
             state = generate_response(state)
         
-        return {
-            "agent": state["current_agent"],
-            "requires_approval": state["requires_approval"],
-            "pending_action": state["pending_action"],
-            "response": state.get("specialist_response", ""),
-            "next_step": next_step,
-        }
+        return OrchestratorResult(
+            agent=state["current_agent"],
+            requires_approval=state["requires_approval"],
+            pending_action=state["pending_action"],
+            response=state["specialist_response"],
+            next_step=next_step,
+            state=state,
+        )
     
     def approve_and_execute(self, state: AgentState) -> AgentState:
         """Execute action after approval."""
         state["approved"] = True
         return execute_action(state)
     
-    def get_agent_for_operation(self, operation: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_agent_for_operation(operation: str) -> str:
         """
         Get the appropriate agent for an operation type.
         
@@ -1,11 +1,34 @@
 """ora.orchestrator.service - Orchestrator service managing multi-agent execution and approvals."""
 
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
-import uuid
+from typing import Callable, Dict, Any, Optional, Sequence, Tuple
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import logging
+import math
+import secrets
+import time
 
-from .graph import OraOrchestrator, AgentState
+from .graph import OraOrchestrator, AgentState, route_to_specialist
+
+logger = logging.getLogger(__name__)
+
+# Max queries remembered by the semantic routing cache
+SEMANTIC_CACHE_SIZE = 256
+
+# Max approve/reject decisions kept in approval_history
+APPROVAL_HISTORY_SIZE = 10_000
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as a UTC ISO 8601 string."""
+    seconds, rem = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=rem // 1000).isoformat()
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return _ns_to_iso(time.time_ns())
 
 
 @dataclass
@@ -18,8 +41,32 @@ class PendingApproval:
     query: str
     authority_required: str
     state: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at_ns: int = field(default_factory=time.time_ns)
     user: str = "Randall"
+    _summary: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Built once: pending approvals are not modified after creation
+        self._summary = {
+            "id": self.id,
+            "agent": self.agent,
+            "operation": self.operation,
+            "description": self.description,
+            "authority_required": self.authority_required,
+            "query": self.query,
+            "created_at": self.created_at,
+            "user": self.user,
+        }
+    
+    @property
+    def created_at(self) -> str:
+        """Creation time as a UTC ISO 8601 string."""
+        return _ns_to_iso(self.created_at_ns)
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """JSON-ready summary of this approval; a new dict callers may modify."""
+        return dict(self._summary)
 
 
 class OrchestratorService:
@@ -37,16 +84,73 @@ class OrchestratorService:
             service.approve(approval_id)
     """
     
-    def __init__(self, orchestrator: Optional[OraOrchestrator] = None):
+    def __init__(
+        self,
+        orchestrator: Optional[OraOrchestrator] = None,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        semantic_threshold: float = 0.95,
+    ):
         """
         Initialize the orchestrator service.
         
         Args:
             orchestrator: Optional OraOrchestrator instance
+            embedder: Optional sentence embedding function. When given,
+                paraphrases of recent queries reuse their routing decision.
+            semantic_threshold: Cosine similarity needed for a semantic cache hit
         """
         self.orchestrator = orchestrator or OraOrchestrator()
         self.pending_approvals: Dict[str, PendingApproval] = {}
-        self.approval_history: list = []
+        # Decision records, oldest first; "timestamp" is time.time_ns()
+        self.approval_history: deque = deque(maxlen=APPROVAL_HISTORY_SIZE)
+        self._approved_count = 0
+        self._rejected_count = 0
+        self.embedder = embedder
+        self.semantic_threshold = semantic_threshold
+        # query -> (unit embedding, specialist), least recently used first
+        self._semantic_cache: "OrderedDict[str, Tuple[Tuple[float, ...], str]]" = OrderedDict()
+    
+    def _semantic_route(self, query: str) -> Optional[str]:
+        """
+        Pick a specialist for query, reusing the routing of a similar recent query.
+        
+        Only the routing decision is cached: the specialist still runs on the
+        new query, so descriptions and approval checks always reflect it.
+        
+        Returns:
+            Specialist name, or None if the embedder failed
+        """
+        cached = self._semantic_cache.get(query)
+        if cached is not None:
+            self._semantic_cache.move_to_end(query)
+            return cached[1]
+        
+        try:
+            vector = tuple(self.embedder(query))
+        except Exception as e:
+            logger.warning(f"Query embedding failed, routing by keywords: {e}")
+            return None
+        
+        norm = math.sqrt(math.sumprod(vector, vector))
+        if norm:
+            vector = tuple(x / norm for x in vector)
+        
+        best_key, best_sim = None, self.semantic_threshold
+        for key, (cached_vector, _) in self._semantic_cache.items():
+            sim = math.sumprod(vector, cached_vector)
+            if sim >= best_sim:
+                best_key, best_sim = key, sim
+        
+        if best_key is not None:
+            self._semantic_cache.move_to_end(best_key)
+            specialist = self._semantic_cache[best_key][1]
+        else:
+            specialist = route_to_specialist(query)
+        
+        self._semantic_cache[query] = (vector, specialist)
+        if len(self._semantic_cache) > SEMANTIC_CACHE_SIZE:
+            self._semantic_cache.popitem(last=False)
+        return specialist
     
     def process_query(self, query: str, user: str = "Randall") -> Dict[str, Any]:
         """
@@ -63,36 +167,39 @@ class OrchestratorService:
             - approval_id: ID to use for approval (if required)
             - pending_action: Details about the pending action
         """
-        result = self.orchestrator.process_query(query)
+        specialist = self._semantic_route(query) if self.embedder is not None else None
+        result = self.orchestrator.process_query(query, specialist=specialist)
+        action = result.pending_action
         
-        if result["requires_approval"]:
-            # Create pending approval
-            approval_id = f"apr_{uuid.uuid4().hex[:12]}"
+        # Callers send the response as JSON
+        response = {
+            "agent": result.agent,
+            "requires_approval": result.requires_approval,
+            "pending_action": asdict(action),
+            "response": result.response,
+            "next_step": result.next_step,
+        }
+        
+        if result.requires_approval:
+            # Create pending approval; the agent's state is kept as-is for execution
+            approval_id = f"apr_{secrets.token_hex(6)}"
             
             pending = PendingApproval(
                 id=approval_id,
-                agent=result["agent"],
-                operation=result["pending_action"].get("operation", ""),
-                description=result["pending_action"].get("description", ""),
+                agent=result.agent,
+                operation=action.operation,
+                description=action.description,
                 query=query,
-                authority_required=result["pending_action"].get("authority_required", "A2"),
-                state={
-                    "messages": [],
-                    "user_query": query,
-                    "current_agent": result["agent"],
-                    "specialist_response": "",
-                    "requires_approval": True,
-                    "approved": False,
-                    "pending_action": result["pending_action"],
-                },
+                authority_required=action.authority_required,
+                state=result.state,
                 user=user,
             )
             
             self.pending_approvals[approval_id] = pending
-            result["approval_id"] = approval_id
-            result["authority_required"] = pending.authority_required
+            response["approval_id"] = approval_id
+            response["authority_required"] = pending.authority_required
         
-        return result
+        return response
     
     def approve(self, approval_id: str, approver: str = "human") -> Dict[str, Any]:
         """
@@ -115,13 +222,14 @@ class OrchestratorService:
         result_state = self.orchestrator.approve_and_execute(state)
         
         # Record in history
+        self._approved_count += 1
         self.approval_history.append({
             "id": approval_id,
             "agent": pending.agent,
             "operation": pending.operation,
             "status": "approved",
             "approver": approver,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time_ns(),
         })
         
         return {
@@ -130,7 +238,7 @@ class OrchestratorService:
             "agent": pending.agent,
             "operation": pending.operation,
             "response": result_state.get("specialist_response", "Action completed"),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
         }
     
     def reject(self, approval_id: str, reason: str = "", rejecter: str = "human") -> Dict[str, Any]:
@@ -151,6 +259,7 @@ class OrchestratorService:
         pending = self.pending_approvals.pop(approval_id)
         
         # Record in history with rejection reason (for learning)
+        self._rejected_count += 1
         self.approval_history.append({
             "id": approval_id,
             "agent": pending.agent,
@@ -158,7 +267,7 @@ class OrchestratorService:
             "status": "rejected",
             "reason": reason,
             "rejecter": rejecter,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time_ns(),
         })
         
         return {
@@ -167,7 +276,7 @@ class OrchestratorService:
             "agent": pending.agent,
             "operation": pending.operation,
             "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
         }
     
     def get_pending(self, approval_id: str) -> Optional[PendingApproval]:
@@ -180,23 +289,13 @@ class OrchestratorService:
     
     def list_pending_summaries(self) -> list[Dict[str, Any]]:
         """List all pending approvals as dictionaries."""
-        return [
-            {
-                "id": p.id,
-                "agent": p.agent,
-                "operation": p.operation,
-                "description": p.description,
-                "authority_required": p.authority_required,
-                "query": p.query,
-                "created_at": p.created_at,
-                "user": p.user,
-            }
-            for p in self.pending_approvals.values()
-        ]
+        return [p.summary for p in self.pending_approvals.values()]
     
     def get_approval_history(self, limit: int = 100) -> list:
-        """Get approval history."""
-        return self.approval_history[-limit:]
+        """Get the most recent approval history, oldest first."""
+        recent = [entry for entry, _ in zip(reversed(self.approval_history), range(limit))]
+        recent.reverse()
+        return [dict(entry, timestamp=_ns_to_iso(entry["timestamp"])) for entry in recent]
     
     def clear_pending(self) -> int:
         """Clear all pending approvals. Returns count cleared."""
@@ -206,12 +305,9 @@ class OrchestratorService:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get orchestrator statistics."""
-        approved = sum(1 for h in self.approval_history if h["status"] == "approved")
-        rejected = sum(1 for h in self.approval_history if h["status"] == "rejected")
-        
         return {
             "pending_count": len(self.pending_approvals),
-            "total_approved": approved,
-            "total_rejected": rejected,
-            "total_processed": len(self.approval_history),
+            "total_approved": self._approved_count,
+            "total_rejected": self._rejected_count,
+            "total_processed": self._approved_count + self._rejected_count,
         }
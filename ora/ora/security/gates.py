@@ -110,29 +110,37 @@ class ShellCommandSanitizer:
         "docker", "kubectl", "terraform",
         "curl", "wget", "ssh", "scp",
     ]
+    _SAFE_COMMAND_SET = frozenset(SAFE_COMMANDS)
 
     def __init__(self, mode: str = "allowlist"):
         self.mode = mode
         self.dangerous_patterns = [re.compile(p) for p in self.DANGEROUS_COMMANDS]
+        # All patterns in one alternation: a safe command is scanned once
+        self._dangerous_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.DANGEROUS_COMMANDS)
+        )
         self.threat_count = 0
 
     def validate(self, command: str) -> Tuple[bool, Optional[str]]:
         """Validate a shell command."""
-        if not command or command.strip() == "":
+        stripped = command.strip() if command else ""
+        if not stripped:
             return (True, None)
 
         # Check for dangerous patterns
-        for pattern in self.dangerous_patterns:
-            if pattern.search(command):
-                self.threat_count += 1
-                reason = f"Blocked: Dangerous pattern detected: {pattern.pattern}"
-                logger.warning(f"Shell command blocked: {command[:100]}")
-                return (False, reason)
+        if self._dangerous_re.search(command):
+            # Report the first listed pattern that matches
+            for pattern in self.dangerous_patterns:
+                if pattern.search(command):
+                    self.threat_count += 1
+                    reason = f"Blocked: Dangerous pattern detected: {pattern.pattern}"
+                    logger.warning(f"Shell command blocked: {command[:100]}")
+                    return (False, reason)
 
         # In allowlist mode, check if base command is allowed
         if self.mode == "allowlist":
-            base_cmd = command.strip().split()[0]
-            if base_cmd not in self.SAFE_COMMANDS:
+            base_cmd = stripped.split(None, 1)[0]
+            if base_cmd not in self._SAFE_COMMAND_SET:
                 reason = f"Blocked: Command '{base_cmd}' not in allowlist"
                 logger.info(f"Shell command not in allowlist: {base_cmd}")
                 return (False, reason)
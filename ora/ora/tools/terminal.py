@@ -8,8 +8,15 @@ Port from BUZZ Neural Core with OrA ShellCommandSanitizer integration.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import os
 import shlex
-from typing import Dict, Any, List, Tuple
+import shutil
+import signal
+import subprocess
+import uuid
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from pathlib import Path
 import logging
 
@@ -17,6 +24,187 @@ from ora.security.gates import ShellCommandSanitizer
 
 logger = logging.getLogger(__name__)
 
+# fork+exec runs off the event loop so a slow spawn doesn't stall other coroutines.
+# Shared across instances since skills create a TerminalTool per call.
+_SPAWN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="term-spawn")
+
+# Output kept per stream; anything past this is drained and dropped
+_MAX_OUTPUT_BYTES = 1024 * 1024
+_READ_CHUNK_BYTES = 65536
+
+# Max cached safety verdicts per TerminalTool
+_VALIDATE_CACHE_SIZE = 1024
+
+# Max cached working directories per TerminalTool
+_CWD_CACHE_SIZE = 64
+
+# Seconds a timed-out process group gets between SIGTERM and SIGKILL
+_KILL_GRACE_SECONDS = 2
+
+# Longest poll interval when waiting for a child without pidfd support
+_WAIT_POLL_MAX = 0.05
+
+# Characters that need /bin/sh to interpret (pipes, redirects, globs, expansion, ...)
+_SHELL_METACHARS = frozenset("|&;<>()$`*?[]{}~#\n")
+
+
+@functools.lru_cache(maxsize=256)
+def _which(name: str) -> Optional[str]:
+    """Resolve an executable name to an absolute path."""
+    return shutil.which(name)
+
+
+def _exec_argv(command: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Split a plain command into (absolute executable path, argv).
+
+    argv[0] stays as the user wrote it, so programs see their usual name.
+    Returns None if the command uses shell syntax or the executable isn't found.
+    """
+    if _SHELL_METACHARS.intersection(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    executable = _which(argv[0]) if argv else None
+    if not executable:
+        return None
+    return executable, argv
+
+
+def _build_argv(command: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Build (executable, argv) for command.
+
+    Plain commands are exec'd directly with an absolute executable path, which
+    skips the intermediate /bin/sh and keeps Popen on its vfork/posix_spawn
+    path. Anything using shell syntax still goes through /bin/sh -c.
+    """
+    return _exec_argv(command) or (None, ["/bin/sh", "-c", command])
+
+
+def _keep(buf: bytearray, cap: int, data: bytes,
+          on_chunk: Optional[Callable[[bytes], None]]) -> None:
+    """Pass data to on_chunk and append it to buf up to cap bytes."""
+    if not data:
+        return
+    if on_chunk is not None:
+        on_chunk(bytes(data))
+    if len(buf) < cap:
+        buf.extend(data[:cap - len(buf)])
+
+
+async def _drain(stream: asyncio.StreamReader, buf: bytearray, cap: int,
+                 on_chunk: Optional[Callable[[bytes], None]] = None) -> None:
+    """Read stream to EOF, keeping at most cap bytes in buf."""
+    while True:
+        chunk = await stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        _keep(buf, cap, chunk, on_chunk)
+
+
+async def _drain_until(stream: asyncio.StreamReader, marker: bytes, buf: bytearray, cap: int,
+                       on_chunk: Optional[Callable[[bytes], None]] = None) -> bytes:
+    """
+    Read stream up to marker, keeping at most cap bytes in buf.
+
+    Returns whatever was read after the marker.
+    """
+    pending = bytearray()
+    tail = len(marker) - 1
+    while True:
+        idx = pending.find(marker)
+        if idx >= 0:
+            _keep(buf, cap, pending[:idx], on_chunk)
+            return bytes(pending[idx + len(marker):])
+        # Hold back enough bytes to match a marker split across reads
+        if len(pending) > tail:
+            _keep(buf, cap, pending[:-tail], on_chunk)
+            del pending[:-tail]
+        chunk = await stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            raise ConnectionResetError("Shell worker exited")
+        pending.extend(chunk)
+
+
+class _SpawnedProcess:
+    """
+    Async handle for a child process spawned in the spawn pool.
+
+    Mirrors the parts of asyncio.subprocess.Process used by TerminalTool.
+    Waiting doesn't hold a pool thread, so long-running commands never
+    delay new spawns.
+    """
+
+    __slots__ = ("_popen", "stdin", "stdout", "stderr")
+
+    def __init__(self, popen: subprocess.Popen, stdout: asyncio.StreamReader,
+                 stderr: asyncio.StreamReader):
+        self._popen = popen
+        self.stdin = popen.stdin
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def pid(self) -> int:
+        return self._popen.pid
+
+    @property
+    def returncode(self):
+        return self._popen.returncode
+
+    async def wait(self) -> int:
+        """Wait for the child to exit without blocking the event loop."""
+        popen = self._popen
+        if popen.returncode is not None:
+            return popen.returncode
+        
+        try:
+            pidfd = os.pidfd_open(popen.pid)
+        except (AttributeError, OSError):
+            # No pidfd support (or already reaped): poll with backoff
+            delay = 0.001
+            while popen.poll() is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _WAIT_POLL_MAX)
+            return popen.returncode
+        
+        # The pidfd turns readable when the child exits
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        try:
+            loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+            try:
+                if popen.poll() is None:
+                    await exited
+            finally:
+                loop.remove_reader(pidfd)
+        finally:
+            os.close(pidfd)
+        return popen.wait()
+
+    def _signal_group(self, sig: int) -> None:
+        try:
+            os.killpg(self._popen.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    async def kill_group(self) -> None:
+        """
+        Stop the child and everything it spawned.
+
+        Sends SIGTERM to the process group, then SIGKILL if it is still
+        running after a short grace period.
+        """
+        self._signal_group(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(self.wait(), timeout=_KILL_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            self._signal_group(signal.SIGKILL)
+            await self.wait()
+
 
 class TerminalTool:
     """
@@ -29,15 +217,33 @@ class TerminalTool:
     Authority: A2 minimum, A3+ for non-whitelist commands
     """
     
-    def __init__(self, workspace_root: str = "/home/randall/1A-PROJECTS/Ora-os"):
+    __slots__ = (
+        "workspace_root", "sanitizer", "whitelist", "persistent_shell",
+        "_spawn_pool", "_validate_cache", "_cwd_cache", "_worker", "_worker_lock",
+    )
+    
+    def __init__(self, workspace_root: str = "/home/randall/1A-PROJECTS/Ora-os",
+                 persistent_shell: bool = False):
         """
         Initialize terminal tool.
         
         Args:
             workspace_root: Root directory for command execution
+            persistent_shell: Run plain commands through one long-lived bash
+                worker instead of spawning a process per call. Worth enabling
+                for long-lived tools that issue many short commands.
+        
+        Running under uvloop (uvicorn picks it when it is installed)
+        is recommended for cheaper subprocess spawns.
         """
         self.workspace_root = Path(workspace_root).resolve()
         self.sanitizer = ShellCommandSanitizer()
+        self.persistent_shell = persistent_shell
+        self._spawn_pool = _SPAWN_POOL
+        self._validate_cache: Dict[str, Tuple[bool, str]] = {}
+        self._cwd_cache: Dict[str, Path] = {}
+        self._worker: Optional[_SpawnedProcess] = None
+        self._worker_lock = asyncio.Lock()
         
         # Command whitelist (allowed without special approval)
         self.whitelist = {
@@ -49,6 +255,30 @@ class TerminalTool:
         logger.info(f"TerminalTool initialized with workspace: {self.workspace_root}")
     
     def _is_safe_command(self, command: str) -> Tuple[bool, str]:
+        """
+        Check if command is safe to execute, reusing earlier verdicts.
+        
+        Only passing verdicts are cached so blocked commands are still
+        counted and logged by the sanitizer every time.
+        
+        Args:
+            command: Command to check
+            
+        Returns:
+            Tuple of (is_safe, reason)
+        """
+        cached = self._validate_cache.get(command)
+        if cached is not None:
+            return cached
+        
+        result = self._validate_command(command)
+        if result[0] and "$(" not in command and "`" not in command:
+            if len(self._validate_cache) >= _VALIDATE_CACHE_SIZE:
+                self._validate_cache.pop(next(iter(self._validate_cache)))
+            self._validate_cache[command] = result
+        return result
+    
+    def _validate_command(self, command: str) -> Tuple[bool, str]:
         """
         Check if command is safe to execute using ShellCommandSanitizer.
         
@@ -75,7 +305,172 @@ class TerminalTool:
             logger.error(f"Command validation failed: {e}")
             return False, f"Validation error: {e}"
     
-    async def execute_command(self, command: str, timeout: int = 30, cwd: str = None) -> Dict[str, Any]:
+    def _resolve_working_dir(self, cwd: Optional[str]) -> Tuple[Path, bool]:
+        """
+        Resolve cwd against the workspace root, caching directories that exist.
+        
+        Args:
+            cwd: Working directory (defaults to workspace root)
+            
+        Returns:
+            Tuple of (working_dir, exists)
+        """
+        key = cwd or ""
+        working_dir = self._cwd_cache.get(key)
+        if working_dir is not None:
+            return working_dir, True
+        
+        working_dir = self.workspace_root
+        if cwd:
+            cwd_path = Path(cwd)
+            if cwd_path.is_absolute():
+                working_dir = cwd_path
+            else:
+                working_dir = self.workspace_root / cwd_path
+        
+        # Ensure working directory exists
+        if not working_dir.is_dir():
+            return working_dir, False
+        
+        if len(self._cwd_cache) >= _CWD_CACHE_SIZE:
+            self._cwd_cache.pop(next(iter(self._cwd_cache)))
+        self._cwd_cache[key] = working_dir
+        return working_dir, True
+    
+    async def _spawn(self, argv: List[str], cwd: Path, stdin=None,
+                     executable: Optional[str] = None) -> _SpawnedProcess:
+        """
+        Spawn argv in the spawn pool and attach async readers to its pipes.
+        
+        Args:
+            argv: Program and arguments to execute
+            cwd: Working directory
+            stdin: stdin for the child (inherited by default)
+            executable: Program to run instead of looking up argv[0]
+            
+        Returns:
+            Handle to the running process
+        """
+        loop = asyncio.get_running_loop()
+        popen = await loop.run_in_executor(
+            self._spawn_pool,
+            functools.partial(
+                subprocess.Popen,
+                argv,
+                executable=executable,
+                shell=False,
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=str(cwd),
+                close_fds=True,
+                preexec_fn=None,
+                restore_signals=True,
+                process_group=0,  # own group so a timeout can kill the whole tree
+            )
+        )
+        
+        readers = []
+        for pipe in (popen.stdout, popen.stderr):
+            reader = asyncio.StreamReader(limit=_MAX_OUTPUT_BYTES)
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+            readers.append(reader)
+        
+        return _SpawnedProcess(popen, readers[0], readers[1])
+    
+    async def _execute_in_worker(self, command: str, executable: str, argv: List[str],
+                                 working_dir: Path, timeout: int,
+                                 on_output: Optional[Callable[[str, bytes], None]]) -> Dict[str, Any]:
+        """
+        Run a plain command through the persistent bash worker.
+        
+        The command runs in a subshell so cd and environment changes don't
+        leak into later commands. Completion is detected by a per-call
+        sentinel echoed after it on both stdout and stderr.
+        
+        Args:
+            command: Original command string
+            executable: Absolute path of the program, from _exec_argv
+            argv: Command split by _exec_argv
+            working_dir: Working directory
+            timeout: Timeout in seconds
+            on_output: Optional output callback
+            
+        Returns:
+            Dictionary with success status and output/error
+        """
+        worker = self._worker
+        if worker is None or worker.returncode is not None:
+            worker = await self._spawn([_which("bash") or "/bin/bash", "--noprofile", "--norc"],
+                                       self.workspace_root, stdin=subprocess.PIPE)
+            self._worker = worker
+        
+        sentinel = f"__ORA_DONE_{uuid.uuid4().hex}__"
+        script = (
+            f"( cd -- {shlex.quote(str(working_dir))} && "
+            f"exec -a {shlex.quote(argv[0])} {shlex.quote(executable)} {shlex.join(argv[1:])} ) </dev/null; "
+            f"printf '%s %d\\n' {sentinel} $?; printf '%s\\n' {sentinel} >&2\n"
+        )
+        worker.stdin.write(script.encode())
+        worker.stdin.flush()
+        
+        marker = sentinel.encode()
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        on_stdout = functools.partial(on_output, "stdout") if on_output else None
+        on_stderr = functools.partial(on_output, "stderr") if on_output else None
+        
+        async def read_exit_code() -> int:
+            rest = await _drain_until(worker.stdout, marker, stdout_buf, _MAX_OUTPUT_BYTES, on_stdout)
+            while b"\n" not in rest:
+                chunk = await worker.stdout.read(_READ_CHUNK_BYTES)
+                if not chunk:
+                    raise ConnectionResetError("Shell worker exited")
+                rest += chunk
+            return int(rest.split()[0])
+        
+        try:
+            exit_code, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    read_exit_code(),
+                    _drain_until(worker.stderr, marker, stderr_buf, _MAX_OUTPUT_BYTES, on_stderr),
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # The command shares the worker's process group; recycle the worker
+            self._worker = None
+            try:
+                await worker.kill_group()
+            except Exception as e:
+                logger.warning(f"Failed to kill timed-out command: {e}")
+            return {
+                "success": False,
+                "error": f"Command timed out after {timeout} seconds",
+                "command": command,
+                "operation": "execute_command"
+            }
+        except Exception:
+            self._worker = None
+            raise
+        
+        return {
+            "success": True,
+            "command": command,
+            "stdout": stdout_buf.decode("utf-8", errors="replace"),
+            "stderr": stderr_buf.decode("utf-8", errors="replace"),
+            "exit_code": exit_code,
+            "operation": "execute_command"
+        }
+    
+    async def close(self) -> None:
+        """Stop the persistent shell worker, if one is running."""
+        worker, self._worker = self._worker, None
+        if worker is not None and worker.returncode is None:
+            await worker.kill_group()
+    
+    async def execute_command(self, command: str, timeout: int = 30, cwd: str = None,
+                              on_output: Optional[Callable[[str, bytes], None]] = None) -> Dict[str, Any]:
         """
         Execute shell command with safety checks.
         
@@ -83,6 +478,7 @@ class TerminalTool:
             command: Command to execute
             timeout: Timeout in seconds (default: 30)
             cwd: Working directory (defaults to workspace root)
+            on_output: Optional callback receiving ("stdout" | "stderr", chunk) as output arrives
             
         Returns:
             Dictionary with success status and output/error
@@ -99,16 +495,8 @@ class TerminalTool:
         
         try:
             # Set working directory
-            working_dir = self.workspace_root
-            if cwd:
-                cwd_path = Path(cwd)
-                if cwd_path.is_absolute():
-                    working_dir = cwd_path
-                else:
-                    working_dir = self.workspace_root / cwd_path
-            
-            # Ensure working directory exists
-            if not working_dir.exists():
+            working_dir, exists = self._resolve_working_dir(cwd)
+            if not exists:
                 return {
                     "success": False,
                     "error": f"Working directory not found: {working_dir}",
@@ -118,24 +506,37 @@ class TerminalTool:
             
             logger.info(f"Executing command: {command} in {working_dir}")
             
+            # Plain commands reuse the persistent worker when it's idle
+            if self.persistent_shell and not self._worker_lock.locked():
+                plain = _exec_argv(command)
+                if plain is not None:
+                    executable, argv = plain
+                    async with self._worker_lock:
+                        return await self._execute_in_worker(command, executable, argv, working_dir,
+                                                             timeout, on_output)
+            
             # Execute command with timeout
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(working_dir),
-                limit=1024 * 1024  # 1MB output limit
-            )
+            executable, argv = _build_argv(command)
+            process = await self._spawn(argv, working_dir, executable=executable)
+            
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            on_stdout = functools.partial(on_output, "stdout") if on_output else None
+            on_stderr = functools.partial(on_output, "stderr") if on_output else None
             
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain(process.stdout, stdout_buf, _MAX_OUTPUT_BYTES, on_stdout),
+                        _drain(process.stderr, stderr_buf, _MAX_OUTPUT_BYTES, on_stderr),
+                        process.wait(),
+                    ),
                     timeout=timeout
                 )
                 
-                # Decode output
-                stdout_str = stdout.decode("utf-8", errors="replace") if stdout else ""
-                stderr_str = stderr.decode("utf-8", errors="replace") if stderr else ""
+                # Decode output once
+                stdout_str = stdout_buf.decode("utf-8", errors="replace")
+                stderr_str = stderr_buf.decode("utf-8", errors="replace")
                 
                 return {
                     "success": True,
@@ -147,12 +548,11 @@ class TerminalTool:
                 }
                 
             except asyncio.TimeoutError:
-                # Kill the process on timeout
+                # Kill the process group on timeout so child workers aren't orphaned
                 try:
-                    process.kill()
-                    await process.wait()
-                except:
-                    pass
+                    await process.kill_group()
+                except Exception as e:
+                    logger.warning(f"Failed to kill timed-out command: {e}")
                 
                 return {
                     "success": False,
@@ -162,6 +562,8 @@ class TerminalTool:
                 }
             
         except Exception as e:
+            # Drop the cached cwd in case the directory has since been removed
+            self._cwd_cache.pop(cwd or "", None)
             logger.error(f"Command execution failed: {e}")
             return {
                 "success": False,
@@ -11,14 +11,39 @@ A2 authority required.
 import aiohttp
 import asyncio
 import re
-from typing import Dict, Any, List, Optional
-import urllib.parse
-import json
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Optional
 import logging
-from datetime import datetime, timedelta
+
+import orjson
+from yarl import URL
 
 logger = logging.getLogger(__name__)
 
+# Rate-limit window in time.monotonic_ns() units
+_RATE_WINDOW_NS = 60_000_000_000
+
+# DuckDuckGo Instant Answer API (free, no API key required)
+_DDG_API_URL = URL("https://api.duckduckgo.com/")
+_DDG_SEARCH_URL = URL("https://duckduckgo.com/")
+
+# aiohttp decodes br only when a Brotli package is installed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# HTML bytes read per page; only the first 5000 chars of text are kept anyway
+_MAX_HTML_BYTES = 200_000
+_HTML_CHUNK_BYTES = 16384
+
+_FETCH_HEADERS = {
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": "OrA-Agent/1.0",
+}
+
 
 class WebSearchTool:
     """
@@ -28,15 +53,21 @@ class WebSearchTool:
     Uses DuckDuckGo Instant Answer API (free, no API key required).
     """
     
+    __slots__ = ("rate_limit_per_minute", "request_times")
+    
     def __init__(self, rate_limit_per_minute: int = 10):
         """
         Initialize web search tool.
         
         Args:
             rate_limit_per_minute: Maximum searches per minute (default: 10)
+        
+        Running under uvloop (uvicorn picks it when it is installed)
+        is recommended for faster socket I/O.
         """
         self.rate_limit_per_minute = rate_limit_per_minute
-        self.request_times: List[datetime] = []
+        # Monotonic ns timestamps of requests in the current window, oldest first
+        self.request_times: Deque[int] = deque()
         
         logger.info(f"WebSearchTool initialized with rate limit: {rate_limit_per_minute}/min")
     
@@ -47,20 +78,20 @@ class WebSearchTool:
         Returns:
             True if request is allowed
         """
-        now = datetime.now()
+        now_ns = time.monotonic_ns()
+        cutoff_ns = now_ns - _RATE_WINDOW_NS
         
         # Remove old request times (older than 1 minute)
-        self.request_times = [
-            t for t in self.request_times 
-            if now - t < timedelta(minutes=1)
-        ]
+        request_times = self.request_times
+        while request_times and request_times[0] <= cutoff_ns:
+            request_times.popleft()
         
         # Check if we're at the limit
-        if len(self.request_times) >= self.rate_limit_per_minute:
+        if len(request_times) >= self.rate_limit_per_minute:
             return False
         
         # Add current request time
-        self.request_times.append(now)
+        request_times.append(now_ns)
         return True
     
     async def search(self, query: str, max_results: int = 10) -> Dict[str, Any]:
@@ -90,21 +121,20 @@ class WebSearchTool:
             }
         
         try:
-            # DuckDuckGo Instant Answer API (free, no API key required)
-            url = "https://api.duckduckgo.com/"
-            params_dict = {
-                "q": query,
-                "format": "json",
-                "no_html": "1",
-                "skip_disambig": "1"
-            }
+            target = _DDG_API_URL.with_query(
+                q=query,
+                format="json",
+                no_html="1",
+                skip_disambig="1"
+            )
             
             logger.info(f"Searching web for: {query}")
             
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params_dict, timeout=30) as response:
+                async with session.get(target, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        # DDG serves JSON as application/x-javascript; parse the raw body
+                        data = orjson.loads(await response.read())
                         
                         results = []
                         
@@ -134,7 +164,7 @@ class WebSearchTool:
                             results.append({
                                 "title": f"Search results for: {query}",
                                 "snippet": f"No instant answer found for '{query}'. Try refining your search terms.",
-                                "url": f"https://duckduckgo.com/?q={urllib.parse.quote(query)}",
+                                "url": str(_DDG_SEARCH_URL.with_query(q=query)),
                                 "source": "DuckDuckGo",
                                 "type": "fallback"
                             })
@@ -199,10 +229,21 @@ class WebSearchTool:
             
             logger.info(f"Fetching webpage: {url}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
+            async with aiohttp.ClientSession(auto_decompress=True) as session:
+                async with session.get(url, headers=_FETCH_HEADERS, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     if response.status == 200:
-                        content = await response.text()
+                        # Stop reading once the HTML budget is spent
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(_HTML_CHUNK_BYTES):
+                            buf.extend(chunk)
+                            if len(buf) >= _MAX_HTML_BYTES:
+                                response.close()
+                                break
+                        try:
+                            content = buf.decode(response.charset or "utf-8", errors="replace")
+                        except LookupError:
+                            # Unknown charset in the Content-Type header
+                            content = buf.decode("utf-8", errors="replace")
                         
                         # Extract title from HTML
                         title = "Webpage"
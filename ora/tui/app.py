@@ -1,10 +1,19 @@
 """OrA — main Textual application."""
 
+import time
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.signal import Signal
+from textual.widgets import Input
 
 from tui.config import OrAConfig
 from tui.screens import MainScreen
+from tui.system_monitor import SystemStats, get_system_stats
+
+
+# Seconds a system stats snapshot is shared before psutil is asked again
+STATS_MAX_AGE = 0.5
 
 
 class OrAApp(App):
@@ -22,12 +31,51 @@ class OrAApp(App):
     def __init__(self) -> None:
         super().__init__()
         self.ora_config = OrAConfig()
+        self._chat_input: Input | None = None
+        # Published with the tick number on every tick_interval; panels
+        # subscribe instead of each running a timer of their own
+        self.tick_signal: Signal[int] = Signal(self, "tick")
+        self._ticks = 0
+        self._stats: SystemStats | None = None
+        self._stats_time = 0.0
 
     def on_mount(self) -> None:
         self.push_screen(MainScreen(self.ora_config))
+        self._ticker = self.set_interval(self.ora_config.tick_interval, self._tick)
+        # No panel updates while suspended (ctrl+z or a shelled-out program)
+        self.app_suspend_signal.subscribe(self, lambda _: self._ticker.pause())
+        self.app_resume_signal.subscribe(self, lambda _: self._ticker.resume())
+        # The screen is composed on the next refresh, so look the input up then
+        self.call_after_refresh(self._cache_chat_input)
 
-    def action_focus_chat(self) -> None:
+    def system_stats(self) -> SystemStats:
+        """
+        Current system stats, shared by every panel and command.
+
+        One psutil read serves all callers within STATS_MAX_AGE, and
+        cpu_percent keeps measuring between the monitor's refreshes
+        instead of being reset by an interleaved /status.
+        """
+        now = time.monotonic()
+        if self._stats is None or now - self._stats_time > STATS_MAX_AGE:
+            self._stats = get_system_stats()
+            self._stats_time = now
+        return self._stats
+
+    def _tick(self) -> None:
+        """Run every subscribed panel's update under one repaint."""
+        self._ticks += 1
+        with self.batch_update():
+            self.tick_signal.publish(self._ticks)
+
+    def _cache_chat_input(self) -> None:
         try:
-            self.query_one("#chat-input").focus()
+            self._chat_input = self.query_one("#chat-input", Input)
         except Exception:
-            pass
+            self._chat_input = None
+
+    def action_focus_chat(self) -> None:
+        if self._chat_input is None or not self._chat_input.is_attached:
+            self._cache_chat_input()
+        if self._chat_input is not None:
+            self._chat_input.focus()
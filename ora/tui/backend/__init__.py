@@ -1,10 +1,11 @@
 """Backend implementations for OrA."""
 
-from typing import Protocol, AsyncIterator
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """A chat message with role and content."""
     role: str  # "user" or "assistant"
@@ -1,27 +1,99 @@
 """LiteLLM-powered chat backend with NVIDIA NIM primary + fallbacks."""
 
+import asyncio
+import hashlib
 import os
+import time
+from collections import OrderedDict, deque
+from contextlib import aclosing
 from pathlib import Path
-from typing import AsyncIterator, Optional, Protocol
+from typing import AsyncGenerator, AsyncIterator, Optional
 from dotenv import load_dotenv
 
-import litellm
-from litellm import acompletion
+from ora.backend import ChatBackend, ChatMessage
 
 # Load environment variables from .env file (look in ora project root)
 # __file__ is /home/randall/ora/src/ora/backend/litellm_backend.py
 # We need to go up 4 levels to get to /home/randall/ora/
-_ora_env_path = Path(__file__).parent.parent.parent.parent / ".env"
-load_dotenv(_ora_env_path, override=True)
+# Child processes inherit the loaded values, so the sentinel skips re-parsing there
+if not os.environ.get("_ORA_ENV_LOADED"):
+    _ora_env_path = Path(__file__).parents[3] / ".env"
+    load_dotenv(_ora_env_path, override=True)
+    os.environ["_ORA_ENV_LOADED"] = "1"
 
 
-class ChatBackend(Protocol):
-    """Protocol that backends must implement."""
-    async def send_message(self, message: str) -> str: ...
-    async def stream_message(self, message: str) -> AsyncIterator[str]: ...
+# Exact-match response cache: max entries and seconds before an entry goes stale
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 300.0
 
-# Suppress verbose LiteLLM logging
-litellm.suppress_debug_info = True
+# Stream batching: the first batch is flushed at STREAM_MIN_BATCH characters,
+# each later threshold grows by STREAM_BATCH_GROWTH up to STREAM_MAX_BATCH, and
+# a partial batch never waits longer than STREAM_FLUSH_INTERVAL seconds
+STREAM_MIN_BATCH = int(os.environ.get("ORA_STREAM_MIN_BATCH", "1"))
+STREAM_MAX_BATCH = int(os.environ.get("ORA_STREAM_MAX_BATCH", "64"))
+STREAM_BATCH_GROWTH = int(os.environ.get("ORA_STREAM_BATCH_GROWTH", "3"))
+STREAM_FLUSH_INTERVAL = float(os.environ.get("ORA_STREAM_FLUSH_INTERVAL", "0.05"))
+
+# Messages sent as chat history: the last 10 exchanges, to avoid token overflow
+HISTORY_MESSAGES = 20
+
+
+async def _content_deltas(response) -> AsyncGenerator[str, None]:
+    """Yield the non-empty text deltas of a LiteLLM streaming response."""
+    try:
+        async for chunk in response:
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+    finally:
+        # Release the HTTP response now rather than at garbage collection
+        aclose = getattr(response, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _batched(deltas: AsyncGenerator[str, None]) -> AsyncIterator[str]:
+    """Coalesce small text deltas into batches bounded by size and time."""
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    buffered = 0
+    limit = STREAM_MIN_BATCH
+    deadline = 0.0
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(deltas))
+            # Wait for the next delta, but not past a partial batch's deadline.
+            # The pending read is never cancelled, so the stream stays intact.
+            timeout = max(0.0, deadline - loop.time()) if buf else None
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+            if done:
+                read, pending = pending, None
+                try:
+                    content = read.result()
+                except StopAsyncIteration:
+                    break
+                if not buf:
+                    deadline = loop.time() + STREAM_FLUSH_INTERVAL
+                buf.append(content)
+                buffered += len(content)
+                if buffered < limit:
+                    continue
+            yield "".join(buf)
+            buf.clear()
+            buffered = 0
+            limit = min(limit * STREAM_BATCH_GROWTH, STREAM_MAX_BATCH)
+        if buf:
+            yield "".join(buf)
+    finally:
+        if pending is not None:
+            # The read has to finish before the stream can be closed
+            pending.cancel()
+            await asyncio.wait((pending,))
+            if not pending.cancelled():
+                pending.exception()
+        await deltas.aclose()
 
 
 class LiteLLMBackend(ChatBackend):
@@ -47,12 +119,30 @@ Be concise. Be helpful. Be real."""
     ) -> None:
         self.model = model
         self.user_name = user_name
-        self.conversation_history: list[dict] = []
+        self.conversation_history: deque[ChatMessage] = deque(maxlen=HISTORY_MESSAGES)
         
         # Memory initialized lazily to avoid blocking on Qdrant connect
         self._memory = None
         self._memory_enabled = enable_memory
         self._memory_checked = False
+        # Result of the first availability probe; None until probed
+        self._mem_available: Optional[bool] = None
+        # Semantic response cache: the memory's Qdrant collection, or the
+        # local SQLite cache when Qdrant is down (chosen on first lookup)
+        self._semantic_cache = None
+        self._semantic_checked = False
+        
+        # litellm is imported on first use: its import pulls in provider
+        # registries and tokenizers that would otherwise delay TUI startup
+        self._acompletion = None
+        # System prompt rendered once for the common no-memory-context case
+        self._empty_system_prompt = self.SYSTEM_PROMPT_TEMPLATE.format(memory_context="")
+        
+        # Memory writes running off the event loop (kept referenced until done)
+        self._background: set[asyncio.Task] = set()
+        
+        # Response cache: key digest -> (monotonic time stored, response)
+        self._response_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
 
         # Set API base for NVIDIA NIM if using their models
         if "nvidia" in model.lower():
@@ -61,6 +151,16 @@ Be concise. Be helpful. Be real."""
                 "https://integrate.api.nvidia.com/v1"
             )
 
+    def _ensure_litellm(self):
+        """Import litellm on first use and return its acompletion."""
+        if self._acompletion is None:
+            import litellm
+            
+            # Suppress verbose LiteLLM logging
+            litellm.suppress_debug_info = True
+            self._acompletion = litellm.acompletion
+        return self._acompletion
+
     @property
     def memory(self):
         """Lazy memory init — won't block startup if Qdrant is down."""
@@ -75,42 +175,151 @@ Be concise. Be helpful. Be real."""
                 self._memory = None
         return self._memory
 
-    def _build_system_prompt(self, user_message: str) -> str:
-        """Build system prompt with optional memory context."""
-        memory_context = ""
+    def _memory_ready(self) -> bool:
+        """Whether persistent memory is usable, probed once (see refresh_memory)."""
+        if self._mem_available is None:
+            memory = self.memory
+            self._mem_available = bool(memory and memory.is_available)
+        return self._mem_available
+
+    def refresh_memory(self) -> bool:
+        """Retry connecting to persistent memory after an earlier failure."""
+        self._memory_checked = False
+        self._mem_available = None
+        self._semantic_checked = False
+        return self._memory_ready()
+
+    def _response_store(self):
+        """Semantic cache store: Qdrant via memory, else local SQLite."""
+        if not self._memory_enabled:
+            return None
+        if not self._semantic_checked:
+            self._semantic_checked = True
+            if self._memory_ready():
+                self._semantic_cache = self.memory
+            else:
+                try:
+                    from ora.memory.sqlite_cache import SQLiteResponseCache
+                    local = SQLiteResponseCache()
+                    self._semantic_cache = local if local.is_available else None
+                except Exception:
+                    self._semantic_cache = None
+        return self._semantic_cache
+
+    async def _abuild_system_prompt(self, user_message: str) -> str:
+        """Build system prompt with optional memory context.
+
+        The memory lookup (embedding + Qdrant RPC) runs in a worker thread so
+        it does not stall other streams on the event loop.
+        """
+        if not self._memory_enabled:
+            return self._empty_system_prompt
 
         try:
-            if self.memory and self.memory.is_available:
-                context = self.memory.get_context_string(user_message, limit=3)
+            if self._mem_available is None:
+                # The first probe connects to Qdrant/Ollama; keep it off the loop
+                await asyncio.to_thread(self._memory_ready)
+            if self._mem_available:
+                context = await self.memory.aget_context_string(user_message, limit=3)
                 if context:
-                    memory_context = f"\n{context}\n"
+                    return self.SYSTEM_PROMPT_TEMPLATE.format(
+                        memory_context=f"\n{context}\n"
+                    )
         except Exception:
             pass
 
-        return self.SYSTEM_PROMPT_TEMPLATE.format(memory_context=memory_context)
+        return self._empty_system_prompt
 
-    def _build_messages(self, user_message: str) -> list[dict]:
+    async def _build_messages(self, user_message: str) -> list[dict]:
         """Build message list with system prompt and history."""
         system_msg = {
             "role": "system",
-            "content": self._build_system_prompt(user_message),
+            "content": await self._abuild_system_prompt(user_message),
         }
         
         # Add user message to history
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_message,
-        })
-        
-        # Keep last 10 exchanges to avoid token overflow
-        recent_history = self.conversation_history[-20:]
+        self._remember("user", user_message)
         
-        return [system_msg] + recent_history
+        return [
+            system_msg,
+            *({"role": m.role, "content": m.content} for m in self.conversation_history),
+        ]
+
+    def _remember(self, role: str, content: str) -> None:
+        """Append a turn to the bounded conversation history."""
+        self.conversation_history.append(ChatMessage(role, content, time.time()))
+
+    def _cache_key(self, messages: list[dict]) -> bytes:
+        """Key a response by model and everything sent with it.
+
+        Covers the system prompt, the earlier turns and the normalized new
+        user message, so a follow-up like "explain more" only hits within
+        the same conversation.
+        """
+        digest = hashlib.blake2b(self.model.encode(), digest_size=16)
+        for m in messages[:-1]:
+            digest.update(f"\0{m['role']}\0{m['content']}".encode())
+        digest.update(f"\0{messages[-1]['content'].strip().lower()}".encode())
+        return digest.digest()
+
+    def _cached_response(self, key: bytes) -> Optional[str]:
+        """Return a fresh cached response for key, dropping it if stale."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, content = entry
+        if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return content
+
+    def _cache_response(self, key: bytes, content: str) -> None:
+        """Store a response, evicting the least recently used when full."""
+        self._response_cache[key] = (time.monotonic(), content)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _semantic_lookup(
+        self, user_message: str
+    ) -> tuple[Optional[list[float]], Optional[str]]:
+        """Embed the message and look for a cached answer to a paraphrase.
+
+        Returns (embedding, cached response); either may be None.
+        """
+        try:
+            store = self._response_store()
+            if store is not None:
+                vector = store.embed(user_message)
+                if vector is not None:
+                    return vector, store.find_cached_response(vector, self.model)
+        except Exception:
+            pass
+        return None, None
+
+    def _semantic_store(self, vector: Optional[list[float]], content: str) -> None:
+        """Save a response in the semantic cache under its message embedding."""
+        store = self._response_store()
+        if vector is None or store is None:
+            return
+        try:
+            store.cache_response(vector, content, self.model)
+        except Exception:
+            pass
+
+    def _in_background(self, func, *args) -> None:
+        """Run a blocking memory write in a worker thread without awaiting it."""
+        if not self._memory_enabled:
+            return
+        task = asyncio.create_task(asyncio.to_thread(func, *args))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
 
     def _store_exchange(self, user_message: str, assistant_response: str) -> None:
         """Store conversation exchange in memory."""
         try:
-            if self.memory and self.memory.is_available:
+            if self._memory_ready():
                 self.memory.add_conversation([
                     {"role": "user", "content": user_message},
                     {"role": "assistant", "content": assistant_response},
@@ -118,11 +327,31 @@ Be concise. Be helpful. Be real."""
         except Exception:
             pass
 
-    async def send_message(self, message: str) -> str:
-        """Send message and get complete response."""
-        messages = self._build_messages(message)
+    async def send_message(self, message: str, no_cache: bool = False) -> str:
+        """Send message and get complete response.
+
+        Identical messages within RESPONSE_CACHE_TTL, then paraphrases found
+        in the semantic cache, reuse an earlier response unless no_cache is set.
+        """
+        messages = await self._build_messages(message)
+        cache_key = self._cache_key(messages)
+        vector = None
+        
+        if not no_cache:
+            cached = self._cached_response(cache_key)
+            if cached is None:
+                # The semantic cache is keyed on the message alone, so only
+                # first turns (system prompt + message) can use it
+                if self._memory_enabled and len(messages) == 2:
+                    vector, cached = await asyncio.to_thread(self._semantic_lookup, message)
+                if cached is not None:
+                    self._cache_response(cache_key, cached)
+            if cached is not None:
+                self._remember("assistant", cached)
+                return cached
         
         try:
+            acompletion = self._ensure_litellm()
             response = await acompletion(
                 model=self.model,
                 messages=messages,
@@ -131,15 +360,17 @@ Be concise. Be helpful. Be real."""
             )
             
             assistant_content = response.choices[0].message.content
+            if assistant_content:
+                self._cache_response(cache_key, assistant_content)
+                if vector is not None:
+                    self._in_background(self._semantic_store, vector, assistant_content)
             
             # Store in conversation history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": assistant_content,
-            })
+            self._remember("assistant", assistant_content)
             
             # Store in persistent memory
-            self._store_exchange(message, assistant_content)
+            if self._mem_available:
+                self._in_background(self._store_exchange, message, assistant_content)
             
             return assistant_content
             
@@ -150,11 +381,36 @@ Be concise. Be helpful. Be real."""
             error_msg = f"[Backend error: {type(e).__name__}] {error_details}"
             return error_msg
 
-    async def stream_message(self, message: str) -> AsyncIterator[str]:
-        """Stream response token by token for real-time UI updates."""
-        messages = self._build_messages(message)
+    async def stream_message(
+        self, message: str, no_cache: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream response in small batches for real-time UI updates.
+
+        The first token is sent immediately; later tokens are coalesced into
+        batches of growing size (see STREAM_MAX_BATCH). A cached response for
+        an identical conversation, or a paraphrased first message, is yielded
+        in one piece unless no_cache is set.
+        """
+        messages = await self._build_messages(message)
+        cache_key = self._cache_key(messages)
+        vector = None
+        
+        if not no_cache:
+            cached = self._cached_response(cache_key)
+            if cached is None:
+                # The semantic cache is keyed on the message alone, so only
+                # first turns (system prompt + message) can use it
+                if self._memory_enabled and len(messages) == 2:
+                    vector, cached = await asyncio.to_thread(self._semantic_lookup, message)
+                if cached is not None:
+                    self._cache_response(cache_key, cached)
+            if cached is not None:
+                self._remember("assistant", cached)
+                yield cached
+                return
         
         try:
+            acompletion = self._ensure_litellm()
             response = await acompletion(
                 model=self.model,
                 messages=messages,
@@ -163,36 +419,51 @@ Be concise. Be helpful. Be real."""
                 stream=True,
             )
             
-            full_response = ""
-            async for chunk in response:
-                if chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    full_response += content
-                    yield content
+            parts: list[str] = []
+            async with aclosing(_batched(_content_deltas(response))) as batches:
+                async for batch in batches:
+                    parts.append(batch)
+                    yield batch
+            full_response = "".join(parts)
+            
+            if full_response:
+                self._cache_response(cache_key, full_response)
+                if vector is not None:
+                    self._in_background(self._semantic_store, vector, full_response)
             
             # Store complete response in history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": full_response,
-            })
+            self._remember("assistant", full_response)
             
             # Store in persistent memory
-            self._store_exchange(message, full_response)
+            if self._mem_available:
+                self._in_background(self._store_exchange, message, full_response)
             
         except Exception as e:
             error_details = str(e)
             error_msg = f"[Backend error: {type(e).__name__}] {error_details}"
             yield error_msg
 
+    def _invalidate_local(self, topic: str) -> None:
+        """Drop cached answers near topic from the local SQLite cache.
+
+        PulZMemory invalidates its own Qdrant cache when it stores a
+        preference or rejection; this covers the fallback store.
+        """
+        store = self._response_store()
+        if store is not None and store is not self.memory:
+            store.invalidate_semantic(topic)
+
     def add_preference(self, preference: str, category: str = "general") -> bool:
         """Store a user preference in persistent memory."""
-        if self.memory:
+        self._invalidate_local(preference)
+        if self._memory_ready():
             return self.memory.add_preference(preference, category)
         return False
 
     def add_rejection(self, operation: str, reason: str) -> bool:
         """Store rejection reason for learning."""
-        if self.memory:
+        self._invalidate_local(operation)
+        if self._memory_ready():
             return self.memory.add_rejection(operation, reason)
         return False
 
@@ -203,4 +474,4 @@ Be concise. Be helpful. Be real."""
     @property
     def memory_available(self) -> bool:
         """Check if persistent memory is available."""
-        return self.memory is not None and self.memory.is_available
+        return self._memory_ready()
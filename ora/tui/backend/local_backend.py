@@ -3,10 +3,17 @@
 Optimized for Feb 2026 models with tool-use and web browsing capabilities.
 """
 
+import asyncio
+import ipaddress
 import os
 import json
+import time
+import weakref
+from types import MappingProxyType
+from urllib.parse import urlsplit
 import httpx
-from typing import AsyncIterator, Optional, List, Dict, Any
+import orjson
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple
 
 # Ollama runs OpenAI-compatible API on port 11434
 OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
@@ -22,6 +29,68 @@ RECOMMENDED_MODELS = [
     "mistral:7b-instruct",        # Good general purpose
 ]
 
+# Model family (name before the ":tag") -> rank in RECOMMENDED_MODELS
+_MODEL_BASE_PRIORITY = {
+    model.split(":")[0]: rank for rank, model in enumerate(RECOMMENDED_MODELS)
+}
+
+# Keep-alive connection pools shared by LocalBackend instances, one per
+# event loop: connections are bound to the loop that opened them
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+# LocalBackend instances not yet closed; the last close() closes the pool
+_open_backends = 0
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the running loop's Ollama HTTP client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return client
+
+
+def _is_loopback(host: str) -> bool:
+    """Whether host names this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+# Chat requests are serialized with orjson and sent as a raw body
+JSON_HEADERS = MappingProxyType({"content-type": "application/json"})
+
+# Bytes read per network chunk when streaming Ollama's NDJSON output
+STREAM_READ_BYTES = 8192
+
+
+def _message_content(line: bytes) -> str:
+    """Extract the message text from one NDJSON line of /api/chat output."""
+    if not line.startswith(b"{"):
+        return ""
+    try:
+        return orjson.loads(line).get("message", {}).get("content", "")
+    except orjson.JSONDecodeError:
+        return ""
+
+
+# Ollama detection shared across instances:
+# base_url -> (available, detected model, monotonic expiry)
+AVAILABILITY_TTL = 30.0
+# Seconds allowed for the TCP connect that precedes the /api/tags request;
+# only loopback hosts are probed, where a refused connect answers at once
+CONNECT_PROBE_TIMEOUT = 0.2
+_availability: Dict[str, Tuple[bool, Optional[str], float]] = {}
+_availability_lock = asyncio.Lock()
+
 
 class LocalBackend:
     """
@@ -58,10 +127,27 @@ Be concise. Be helpful. Be real."""
         base_url: str = OLLAMA_BASE_URL,
     ) -> None:
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=120.0)
+        self._chat_url = f"{base_url}/api/chat"
+        # Host and port for the TCP pre-check in _probe(), loopback only
+        url = urlsplit(base_url)
+        default_port = 443 if url.scheme == "https" else 80
+        host = url.hostname or "localhost"
+        self._probe_address = (
+            (host, url.port or default_port) if _is_loopback(host) else None
+        )
+        # The system turn never changes; each request appends the user turn
+        self._base_messages = ({"role": "system", "content": self.SYSTEM_PROMPT},)
         self._available: Optional[bool] = None
         self._model: Optional[str] = model
         self._detected_model: Optional[str] = None
+        global _open_backends
+        _open_backends += 1
+        self._closed = False
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client from the running loop's pool, shared across instances."""
+        return _get_client()
 
     @property
     def model(self) -> str:
@@ -69,10 +155,48 @@ Be concise. Be helpful. Be real."""
         return self._model or self._detected_model or "llama3.1:8b-instruct"
 
     async def is_available(self) -> bool:
-        """Check if Ollama is running and detect best available model."""
+        """
+        Check if Ollama is running and detect best available model.
+        
+        The probe result is shared with other instances on the same base_url
+        for AVAILABILITY_TTL seconds.
+        """
         if self._available is not None:
             return self._available
         
+        cached = _availability.get(self.base_url)
+        if cached is None or cached[2] <= time.monotonic():
+            async with _availability_lock:
+                # Another instance may have probed while we waited
+                cached = _availability.get(self.base_url)
+                if cached is None or cached[2] <= time.monotonic():
+                    available, detected = await self._probe()
+                    cached = (available, detected, time.monotonic() + AVAILABILITY_TTL)
+                    _availability[self.base_url] = cached
+        
+        self._available, detected, _ = cached
+        if detected is not None:
+            self._detected_model = detected
+        return self._available
+
+    async def _probe(self) -> Tuple[bool, Optional[str]]:
+        """Query Ollama's model list. Returns (available, detected model)."""
+        # A bare TCP connect fails fast when nothing is listening, instead
+        # of waiting on the HTTP client's connect timeout. A slow connect is
+        # left for the HTTP request to settle rather than cached as down.
+        if self._probe_address is not None:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(*self._probe_address),
+                    CONNECT_PROBE_TIMEOUT,
+                )
+                writer.close()
+                await writer.wait_closed()
+            except asyncio.TimeoutError:
+                pass
+            except OSError:
+                return False, None
+        
         try:
             response = await self.client.get(f"{self.base_url}/api/tags")
             if response.status_code == 200:
@@ -80,28 +204,22 @@ Be concise. Be helpful. Be real."""
                 available_models = [m.get("name", "") for m in data.get("models", [])]
                 
                 if not available_models:
-                    self._available = False
-                    return False
+                    return False, None
                 
-                # Auto-detect best model from recommended list
-                for recommended in RECOMMENDED_MODELS:
-                    model_base = recommended.split(":")[0]
-                    for available in available_models:
-                        if model_base in available:
-                            self._detected_model = available
-                            self._available = True
-                            return True
+                # Auto-detect best model from recommended list, in one pass
+                best, best_rank = available_models[0], len(RECOMMENDED_MODELS)
+                for available in available_models:
+                    rank = _MODEL_BASE_PRIORITY.get(available.split(":")[0], best_rank)
+                    if rank < best_rank:
+                        best, best_rank = available, rank
                 
-                # Use first available if no recommended found
-                self._detected_model = available_models[0]
-                self._available = True
-                return True
+                # Falls back to the first available if no recommended found
+                return True, best
                 
         except Exception:
             pass
         
-        self._available = False
-        return False
+        return False, None
 
     async def list_models(self) -> List[str]:
         """List available models in Ollama."""
@@ -114,6 +232,25 @@ Be concise. Be helpful. Be real."""
             pass
         return []
 
+    def _chat_body(
+        self,
+        message: str,
+        stream: bool,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> bytes:
+        """Serialize an /api/chat request for message."""
+        payload = {
+            "model": self.model,
+            "messages": [*self._base_messages, {"role": "user", "content": message}],
+            "stream": stream,
+        }
+        
+        # Add tools for function calling if provided
+        if tools:
+            payload["tools"] = tools
+        
+        return orjson.dumps(payload)
+
     async def send_message(
         self, 
         message: str,
@@ -124,22 +261,10 @@ Be concise. Be helpful. Be real."""
             return "[Ollama not available. Start with: ollama serve]"
         
         try:
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": message},
-                ],
-                "stream": False,
-            }
-            
-            # Add tools for function calling if provided
-            if tools:
-                payload["tools"] = tools
-            
             response = await self.client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
+                self._chat_url,
+                content=self._chat_body(message, False, tools),
+                headers=JSON_HEADERS,
             )
             
             if response.status_code == 200:
@@ -166,36 +291,47 @@ Be concise. Be helpful. Be real."""
         try:
             async with self.client.stream(
                 "POST",
-                f"{self.base_url}/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": message},
-                    ],
-                    "stream": True,
-                },
+                self._chat_url,
+                content=self._chat_body(message, True),
+                headers=JSON_HEADERS,
             ) as response:
-                async for line in response.aiter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            content = data.get("message", {}).get("content", "")
-                            if content:
-                                yield content
-                        except json.JSONDecodeError:
-                            continue
+                # Split the raw byte stream into lines ourselves; a network
+                # chunk usually carries several token events
+                pending = b""
+                async for chunk in response.aiter_bytes(STREAM_READ_BYTES):
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        content = _message_content(line)
+                        if content:
+                            yield content
+                content = _message_content(pending)
+                if content:
+                    yield content
                             
         except Exception as e:
             yield f"[Local backend error: {type(e).__name__}]"
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """
+        Release this backend.
+        
+        The shared client stays open while other instances use it; the
+        last instance to close shuts it down.
+        """
+        global _open_backends
+        if self._closed:
+            return
+        self._closed = True
+        _open_backends -= 1
+        if _open_backends == 0:
+            client = _clients.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
 
 
-# Terminal command library for agentic tasks
-TERMINAL_COMMANDS = {
+# Terminal command library for agentic tasks (read-only)
+TERMINAL_COMMANDS = MappingProxyType({
     # File operations
     "list_files": "ls -la",
     "list_tree": "tree -L 2",
@@ -225,4 +361,4 @@ TERMINAL_COMMANDS = {
     # Docker
     "docker_ps": "docker ps --format 'table {{.Names}}\\t{{.Image}}\\t{{.Status}}'",
     "docker_images": "docker images --format 'table {{.Repository}}\\t{{.Tag}}\\t{{.Size}}'",
-}
+})
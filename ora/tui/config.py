@@ -1,5 +1,6 @@
 """OrA application configuration."""
 
+import os
 import time
 from dataclasses import dataclass, field
 
@@ -8,5 +9,12 @@ from dataclasses import dataclass, field
 class OrAConfig:
     user_name: str = "Randall"
     refresh_interval: float = 5.0
+    # Period of the app-wide timer that drives every live panel
+    tick_interval: float = 1.0
     max_chat_history: int = 500
-    session_start: float = field(default_factory=time.time)
+    # Embedding cache in front of keyword routing; needs the "semantic" extra
+    semantic_routing: bool = field(
+        default_factory=lambda: os.environ.get("ORA_SEMANTIC_ROUTING") == "1"
+    )
+    # time.monotonic() at startup; only used to measure uptime
+    session_start: float = field(default_factory=time.monotonic)
@@ -1,11 +1,41 @@
 """Persistent memory layer using Mem0 + Qdrant."""
 
+import asyncio
+import atexit
 import os
+import queue
+import threading
+import time
+import uuid
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+# Ollama server used by Mem0 for both embeddings and fact extraction
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+
+# Semantic response cache: nomic-embed-text vector size, minimum cosine
+# similarity for a hit, and seconds before a cached response goes stale
+RESPONSE_CACHE_DIM = 768
+RESPONSE_CACHE_THRESHOLD = 0.92
+RESPONSE_CACHE_TTL = 3600.0
+
+# Cosine distance around an updated topic within which cached responses are
+# dropped, and the most entries one invalidation removes
+INVALIDATION_RADIUS = 0.15
+INVALIDATION_LIMIT = 256
+
+# Conversation writes are batched: up to this many exchanges, or whatever
+# arrived within this many seconds of the first, go to Mem0 in one add()
+WRITE_BATCH_SIZE = 8
+WRITE_BATCH_INTERVAL = 2.0
+
+# Longest wait for queued writes at exit, or before reading/clearing memory,
+# so a hung Mem0/Ollama can't block forever
+FLUSH_TIMEOUT = 10.0
+
+
+@dataclass(slots=True, frozen=True)
 class MemoryResult:
     """A single memory search result."""
     content: str
@@ -28,12 +58,22 @@ class PulZMemory:
         user_id: str = "randall",
         qdrant_host: str = "localhost",
         qdrant_port: int = 6333,
+        ollama_base_url: str = OLLAMA_BASE_URL,
+        response_cache_ttl: float = RESPONSE_CACHE_TTL,
     ) -> None:
         self.user_id = user_id
         self._memory = None
         self._qdrant_host = qdrant_host
         self._qdrant_port = qdrant_port
+        self._ollama_base_url = ollama_base_url
         self._initialized = False
+        self._response_collection = f"ora_response_cache_{user_id}"
+        self._response_cache_ready = False
+        self._response_cache_ttl = response_cache_ttl
+        # Write-behind queue of (messages, session_id), drained by a daemon thread
+        self._write_queue: "queue.Queue[tuple[List[Dict[str, str]], Optional[str]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
 
     def _ensure_initialized(self) -> bool:
         """Lazy initialization of Mem0 connection."""
@@ -56,12 +96,14 @@ class PulZMemory:
                     "provider": "ollama",
                     "config": {
                         "model": "nomic-embed-text:latest",
+                        "ollama_base_url": self._ollama_base_url,
                     },
                 },
                 "llm": {
                     "provider": "ollama",
                     "config": {
                         "model": "qwen2.5-coder:3b",
+                        "ollama_base_url": self._ollama_base_url,
                     },
                 },
                 "version": "v1.1",
@@ -81,31 +123,94 @@ class PulZMemory:
         session_id: Optional[str] = None,
     ) -> bool:
         """
-        Store a conversation exchange in memory.
+        Queue a conversation exchange to be stored in memory.
+        
+        Exchanges are written in batches by a background thread, so this
+        returns without waiting for embedding or Qdrant. Call flush() to
+        wait for queued writes.
         
         Args:
             messages: List of {"role": "user/assistant", "content": "..."}
             session_id: Optional session identifier for grouping
         
         Returns:
-            True if stored successfully, False otherwise
+            True if queued, False if memory is unavailable
         """
         if not self._ensure_initialized():
             return False
         
-        try:
+        self._start_writer()
+        self._write_queue.put((messages, session_id))
+        return True
+
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """
+        Block until every queued conversation exchange has been written.
+        
+        Returns False if writes were still pending after timeout seconds
+        (None waits indefinitely).
+        """
+        done = self._write_queue.all_tasks_done
+        with done:
+            return done.wait_for(lambda: not self._write_queue.unfinished_tasks, timeout)
+
+    def _discard_queued(self) -> None:
+        """Drop exchanges that haven't been handed to the writer yet."""
+        while True:
+            try:
+                self._write_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._write_queue.task_done()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop,
+                    name=f"pulz-memory-{self.user_id}",
+                    daemon=True,
+                )
+                self._writer.start()
+                atexit.register(self.flush)
+
+    def _write_loop(self) -> None:
+        """Drain the write queue in batches for the life of the process."""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            self._write_batch(batch)
+            for _ in batch:
+                self._write_queue.task_done()
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """Store a batch of exchanges with one Mem0 add() per session."""
+        by_session: Dict[Optional[str], List[Dict[str, str]]] = {}
+        for messages, session_id in batch:
+            by_session.setdefault(session_id, []).extend(messages)
+        
+        for session_id, messages in by_session.items():
             metadata = {"source": "ora_chat"}
             if session_id:
                 metadata["session_id"] = session_id
-            
-            self._memory.add(
-                messages,
-                user_id=self.user_id,
-                metadata=metadata,
-            )
-            return True
-        except Exception:
-            return False
+            try:
+                self._memory.add(
+                    messages,
+                    user_id=self.user_id,
+                    metadata=metadata,
+                )
+            except Exception:
+                pass
 
     def add_preference(self, preference: str, category: str = "general") -> bool:
         """
@@ -122,6 +227,7 @@ class PulZMemory:
                 user_id=self.user_id,
                 metadata={"type": "preference", "category": category},
             )
+            self.invalidate_semantic(preference)
             return True
         except Exception:
             return False
@@ -142,6 +248,7 @@ class PulZMemory:
                 user_id=self.user_id,
                 metadata={"type": "rejection", "operation": operation},
             )
+            self.invalidate_semantic(operation)
             return True
         except Exception:
             return False
@@ -173,6 +280,14 @@ class PulZMemory:
         except Exception:
             return []
 
+    async def asearch(self, query: str, limit: int = 5) -> List[MemoryResult]:
+        """search() in a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.search, query, limit)
+
+    async def aget_context_string(self, query: str, limit: int = 3) -> str:
+        """get_context_string() in a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.get_context_string, query, limit)
+
     def get_context_string(self, query: str, limit: int = 3) -> str:
         """
         Get formatted context string from relevant memories.
@@ -190,11 +305,138 @@ class PulZMemory:
         
         return "\n".join(context_lines)
 
+    def _ensure_response_cache(self) -> bool:
+        """Lazily create the Qdrant collection backing the response cache."""
+        if self._response_cache_ready:
+            return True
+        if not self._ensure_initialized():
+            return False
+        
+        try:
+            from qdrant_client.models import Distance, VectorParams
+            
+            client = self._memory.vector_store.client
+            if not client.collection_exists(self._response_collection):
+                client.create_collection(
+                    collection_name=self._response_collection,
+                    vectors_config=VectorParams(
+                        size=RESPONSE_CACHE_DIM,
+                        distance=Distance.COSINE,
+                    ),
+                )
+            self._response_cache_ready = True
+            return True
+        except Exception:
+            return False
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text with Mem0's configured embedder (no extra model load)."""
+        if not self._ensure_initialized():
+            return None
+        
+        try:
+            return list(self._memory.embedding_model.embed(text))
+        except Exception:
+            return None
+
+    def find_cached_response(
+        self,
+        vector: List[float],
+        model: str,
+        threshold: float = RESPONSE_CACHE_THRESHOLD,
+        max_age: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Find a recent response from model to a semantically similar message.
+        
+        max_age defaults to this memory's response_cache_ttl.
+        Returns the cached response text, or None on a miss.
+        """
+        if not self._ensure_response_cache():
+            return None
+        if max_age is None:
+            max_age = self._response_cache_ttl
+        
+        try:
+            from qdrant_client.models import FieldCondition, Filter, MatchValue, Range
+            
+            hits = self._memory.vector_store.client.query_points(
+                collection_name=self._response_collection,
+                query=vector,
+                limit=1,
+                score_threshold=threshold,
+                query_filter=Filter(must=[
+                    FieldCondition(key="model", match=MatchValue(value=model)),
+                    FieldCondition(key="ts", range=Range(gte=time.time() - max_age)),
+                ]),
+            ).points
+            if hits:
+                return hits[0].payload.get("response")
+        except Exception:
+            pass
+        return None
+
+    def cache_response(self, vector: List[float], response: str, model: str) -> bool:
+        """Store a response under its message embedding for semantic reuse."""
+        if not self._ensure_response_cache():
+            return False
+        
+        try:
+            from qdrant_client.models import PointStruct
+            
+            self._memory.vector_store.client.upsert(
+                collection_name=self._response_collection,
+                points=[PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector=vector,
+                    payload={"response": response, "ts": time.time(), "model": model},
+                )],
+            )
+            return True
+        except Exception:
+            return False
+
+    def invalidate_semantic(self, topic: str, radius: float = INVALIDATION_RADIUS) -> int:
+        """
+        Drop cached responses within radius (cosine distance) of topic.
+        
+        Called when a preference or rejection changes what a good answer
+        looks like, so paraphrases of the topic stop reusing old replies.
+        Returns the number of responses removed.
+        """
+        if not self._ensure_response_cache():
+            return 0
+        
+        vector = self.embed(topic)
+        if vector is None:
+            return 0
+        
+        try:
+            from qdrant_client.models import PointIdsList
+            
+            client = self._memory.vector_store.client
+            hits = client.query_points(
+                collection_name=self._response_collection,
+                query=vector,
+                limit=INVALIDATION_LIMIT,
+                score_threshold=1.0 - radius,
+                with_payload=False,
+            ).points
+            if hits:
+                client.delete(
+                    collection_name=self._response_collection,
+                    points_selector=PointIdsList(points=[hit.id for hit in hits]),
+                )
+            return len(hits)
+        except Exception:
+            return 0
+
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all memories for this user."""
         if not self._ensure_initialized():
             return []
         
+        self.flush()
         try:
             return self._memory.get_all(user_id=self.user_id)
         except Exception:
@@ -205,6 +447,9 @@ class PulZMemory:
         if not self._ensure_initialized():
             return False
         
+        # Queued exchanges would otherwise be written after the delete
+        self._discard_queued()
+        self.flush()
         try:
             self._memory.delete_all(user_id=self.user_id)
             return True
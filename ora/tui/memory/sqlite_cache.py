@@ -0,0 +1,246 @@
+"""Local semantic response cache using SQLite + sqlite-vec.
+
+Keeps the response cache usable without a running Qdrant: vectors live in a
+sqlite-vec table on disk and embeddings come straight from Ollama.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+from ora.memory.pulz_memory import (
+    INVALIDATION_LIMIT,
+    INVALIDATION_RADIUS,
+    OLLAMA_BASE_URL,
+    RESPONSE_CACHE_DIM,
+    RESPONSE_CACHE_THRESHOLD,
+    RESPONSE_CACHE_TTL,
+)
+
+
+# Nearest neighbours fetched per lookup; the closest one may belong to
+# another model or be stale, so a few candidates are checked in order
+CANDIDATES = 4
+
+
+class SQLiteResponseCache:
+    """
+    Semantic response cache stored in a local SQLite file.
+
+    Same interface as PulZMemory's response cache (embed,
+    find_cached_response, cache_response), so LiteLLMBackend can fall back
+    to it when Qdrant is down. Requires the optional sqlite-vec package and
+    an sqlite3 build that can load extensions; otherwise is_available is
+    False and every call is a no-op.
+    """
+
+    DB_PATH = Path.home() / ".ora" / "response_cache.db"
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ollama_base_url: str = OLLAMA_BASE_URL,
+        embed_model: str = "nomic-embed-text:latest",
+        response_cache_ttl: float = RESPONSE_CACHE_TTL,
+    ) -> None:
+        self._db_path = db_path or self.DB_PATH
+        self._ollama_base_url = ollama_base_url.rstrip("/")
+        self._embed_model = embed_model
+        self._response_cache_ttl = response_cache_ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._client: Optional[httpx.Client] = None
+        self._checked = False
+        # Lookups and stores run in worker threads; one connection, serialized
+        self._lock = threading.Lock()
+
+    def _ensure_initialized(self) -> bool:
+        """Open the database and load sqlite-vec on first use."""
+        if self._checked:
+            return self._conn is not None
+        self._checked = True
+
+        try:
+            import sqlite_vec
+
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS cache USING vec0("
+                f"embedding float[{RESPONSE_CACHE_DIM}] distance_metric=cosine)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    id INTEGER PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    ts REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_ts ON responses(ts)")
+            conn.commit()
+
+            self._conn = conn
+            self._client = httpx.Client(
+                base_url=self._ollama_base_url,
+                timeout=httpx.Timeout(30.0, connect=2.0),
+            )
+            return True
+
+        except Exception:
+            # sqlite-vec missing or extensions unsupported - cache disabled
+            return False
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text with Ollama's /api/embed endpoint."""
+        if not self._ensure_initialized():
+            return None
+
+        try:
+            response = self._client.post(
+                "/api/embed",
+                json={"model": self._embed_model, "input": text},
+            )
+            response.raise_for_status()
+            return response.json()["embeddings"][0]
+        except Exception:
+            return None
+
+    def find_cached_response(
+        self,
+        vector: List[float],
+        model: str,
+        threshold: float = RESPONSE_CACHE_THRESHOLD,
+        max_age: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Find a recent response from model to a semantically similar message.
+
+        max_age defaults to this cache's response_cache_ttl.
+        Returns the cached response text, or None on a miss.
+        """
+        if not self._ensure_initialized():
+            return None
+        if max_age is None:
+            max_age = self._response_cache_ttl
+
+        try:
+            import sqlite_vec
+
+            with self._lock:
+                rows = self._conn.execute(
+                    """
+                    SELECT r.model, r.response, r.ts, c.distance
+                    FROM (
+                        SELECT rowid, distance FROM cache
+                        WHERE embedding MATCH ? AND k = ?
+                    ) AS c
+                    JOIN responses AS r ON r.id = c.rowid
+                    ORDER BY c.distance
+                    """,
+                    (sqlite_vec.serialize_float32(vector), CANDIDATES),
+                ).fetchall()
+        except Exception:
+            return None
+
+        oldest = time.time() - max_age
+        for row_model, response, ts, distance in rows:
+            # Cosine distance; similarity below threshold means no later row hits
+            if 1.0 - distance < threshold:
+                break
+            if row_model == model and ts >= oldest:
+                return response
+        return None
+
+    def cache_response(self, vector: List[float], response: str, model: str) -> bool:
+        """Store a response under the embedding of the message it answered."""
+        if not self._ensure_initialized():
+            return False
+
+        try:
+            import sqlite_vec
+
+            now = time.time()
+            with self._lock:
+                conn = self._conn
+                # Drop expired entries so the file doesn't grow without bound
+                expired = [
+                    row[0] for row in conn.execute(
+                        "SELECT id FROM responses WHERE ts < ?",
+                        (now - self._response_cache_ttl,),
+                    )
+                ]
+                self._delete(expired)
+
+                cursor = conn.execute(
+                    "INSERT INTO responses (model, response, ts) VALUES (?, ?, ?)",
+                    (model, response, now),
+                )
+                conn.execute(
+                    "INSERT INTO cache (rowid, embedding) VALUES (?, ?)",
+                    (cursor.lastrowid, sqlite_vec.serialize_float32(vector)),
+                )
+                conn.commit()
+            return True
+        except Exception:
+            return False
+
+    def invalidate_semantic(self, topic: str, radius: float = INVALIDATION_RADIUS) -> int:
+        """
+        Drop cached responses within radius (cosine distance) of topic.
+
+        Returns the number of responses removed.
+        """
+        vector = self.embed(topic)
+        if vector is None:
+            return 0
+
+        try:
+            import sqlite_vec
+
+            with self._lock:
+                ids = [
+                    row[0] for row in self._conn.execute(
+                        "SELECT rowid, distance FROM cache WHERE embedding MATCH ? AND k = ?",
+                        (sqlite_vec.serialize_float32(vector), INVALIDATION_LIMIT),
+                    )
+                    if row[1] <= radius
+                ]
+                self._delete(ids)
+                self._conn.commit()
+            return len(ids)
+        except Exception:
+            return 0
+
+    def _delete(self, ids: List[int]) -> None:
+        """Remove entries from both tables; caller holds the lock and commits."""
+        if ids:
+            params = [(i,) for i in ids]
+            self._conn.executemany("DELETE FROM cache WHERE rowid = ?", params)
+            self._conn.executemany("DELETE FROM responses WHERE id = ?", params)
+
+    def clear(self) -> bool:
+        """Delete every cached response."""
+        if not self._ensure_initialized():
+            return False
+
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache")
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+            return True
+        except Exception:
+            return False
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the local cache can be used."""
+        return self._ensure_initialized()
@@ -4,6 +4,7 @@ from ora.orchestrator.graph import (
     SimpleOrchestrator,
     AgentState,
     route_to_specialist,
+    routing_cache_info,
     AGENT_NODES,
 )
 from ora.orchestrator.service import OrchestratorService, PendingApproval
@@ -14,5 +15,6 @@ __all__ = [
     "PendingApproval",
     "AgentState",
     "route_to_specialist",
+    "routing_cache_info",
     "AGENT_NODES",
 ]
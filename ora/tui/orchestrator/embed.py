@@ -0,0 +1,111 @@
+"""Batched, de-duplicated embedding calls for async callers."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Requests arriving within EMBED_BATCH_WINDOW seconds of the first are sent
+# to the model together, up to EMBED_BATCH_SIZE texts per call
+EMBED_BATCH_SIZE = 32
+EMBED_BATCH_WINDOW = 0.02
+
+# Recently computed embeddings kept for repeats of the same text
+EMBED_CACHE_SIZE = 256
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce embed() calls into batched model calls.
+
+    Identical texts share one embedding, whether they are in flight or
+    recently computed, keyed by a 128-bit BLAKE2b digest of the text. The
+    model call runs in a worker thread so the event loop stays free.
+
+    Usage:
+        batcher = EmbeddingBatcher(model.embed)
+        vector = await batcher.embed("delete old files")
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Iterable[Sequence[float]]],
+        batch_size: int = EMBED_BATCH_SIZE,
+        window: float = EMBED_BATCH_WINDOW,
+        cache_size: int = EMBED_CACHE_SIZE,
+    ) -> None:
+        self._embed_batch = embed_batch
+        self.batch_size = batch_size
+        self.window = window
+        self.cache_size = cache_size
+        self._queue: Optional["asyncio.Queue[Tuple[bytes, str]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._done: OrderedDict[bytes, Sequence[float]] = OrderedDict()
+
+    async def close(self) -> None:
+        """Stop the batching task; callers still waiting are cancelled."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            await asyncio.wait((worker,))
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._queue = None
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Digest identifying a text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    async def embed(self, text: str) -> Sequence[float]:
+        """Embedding of text, computed in the next batch if not already known."""
+        key = self._key(text)
+        vector = self._done.get(key)
+        if vector is not None:
+            self._done.move_to_end(key)
+            return vector
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if self._queue is None:
+                self._queue = asyncio.Queue()
+            if self._worker is None or self._worker.done():
+                self._worker = asyncio.create_task(self._drain())
+            self._queue.put_nowait((key, text))
+
+        # Shielded: one caller giving up must not cancel the others' result
+        return await asyncio.shield(future)
+
+    async def _drain(self) -> None:
+        """Collect queued texts into batches and embed each batch."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.window)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            texts = [text for _, text in batch]
+            try:
+                vectors = list(await asyncio.to_thread(self._embed_batch, texts))
+                if len(vectors) != len(texts):
+                    raise ValueError(f"expected {len(texts)} embeddings, got {len(vectors)}")
+            except Exception as e:
+                for key, _ in batch:
+                    future = self._pending.pop(key)
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (key, _), vector in zip(batch, vectors):
+                self._done[key] = vector
+                future = self._pending.pop(key)
+                if not future.done():
+                    future.set_result(vector)
+            while len(self._done) > self.cache_size:
+                self._done.popitem(last=False)
@@ -1,11 +1,15 @@
 """LangGraph multi-agent orchestration with specialist routing."""
 
-from typing import TypedDict, Annotated, Literal, List, Dict, Any
+from typing import TypedDict, Annotated, Literal, List, Dict, Any, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 import operator
+import re
 
+from ora.orchestrator.semantic_router import SemanticRouteCache
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AgentAction:
     """Proposed action requiring potential approval."""
     agent: str
@@ -18,6 +22,7 @@ class AgentState(TypedDict):
     """State passed through the agent graph."""
     messages: Annotated[List[Dict[str, str]], operator.add]
     user_query: str
+    user_query_lower: str
     current_agent: str
     specialist_response: str
     requires_approval: bool
@@ -33,49 +38,140 @@ ROUTING_KEYWORDS = {
     "security": ["security", "scan", "vulnerability", "audit", "password", "secret", "encrypt", "permission"],
 }
 
+SPECIALIST_NAMES = tuple(ROUTING_KEYWORDS)
+
+# Each distinct keyword with the index of every specialist listing it
+_KEYWORD_MATCHER = tuple(
+    (keyword, tuple(i for i, kws in enumerate(ROUTING_KEYWORDS.values()) if keyword in kws))
+    for keyword in dict.fromkeys(kw for kws in ROUTING_KEYWORDS.values() for kw in kws)
+)
+
+
+def _build_keyword_automaton():
+    """
+    Compile the routing keywords into an Aho-Corasick automaton.
+    
+    Returns None when pyahocorasick (the "perf" extra) isn't installed, in
+    which case routing tests each keyword with a substring search instead.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, specialist_ids in _KEYWORD_MATCHER:
+        automaton.add_word(keyword, (keyword, specialist_ids))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 # Operations that require human approval
 DANGEROUS_OPERATIONS = [
     "delete", "remove", "kill", "terminate", "modify", "write", "execute",
     "install", "uninstall", "format", "overwrite", "sudo", "admin",
 ]
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_OPERATIONS)))
 
+# Per-agent keywords that turn an operation into one needing approval
+_CODE_MODIFY_RE = re.compile(r"write|modify|refactor|fix")
+_SECURITY_APPROVAL_RE = re.compile(r"fix|patch|modify|change")
 
-def route_to_specialist(state: AgentState) -> Literal["code", "research", "system", "security"]:
+
+@lru_cache(maxsize=512)
+def _route_cached(query: str) -> Literal["code", "research", "system", "security"]:
     """
-    Route user query to the appropriate specialist agent.
+    Score an already-lowercased query against the routing keywords.
     
-    Uses keyword matching for fast routing. Can be enhanced with
-    semantic routing via embeddings in the future.
+    Uses one Aho-Corasick pass over the query when pyahocorasick is
+    installed, otherwise one substring search per keyword. Memoized, so
+    repeated queries skip the scan.
     """
-    query = state["user_query"].lower()
+    if _KEYWORD_AUTOMATON is not None:
+        # A keyword found several times still counts once
+        matched = {
+            keyword: specialist_ids
+            for _, (keyword, specialist_ids) in _KEYWORD_AUTOMATON.iter(query)
+        }.values()
+    else:
+        matched = [
+            specialist_ids
+            for keyword, specialist_ids in _KEYWORD_MATCHER
+            if keyword in query
+        ]
     
     # Count keyword matches per specialist
-    scores = {specialist: 0 for specialist in ROUTING_KEYWORDS}
-    
-    for specialist, keywords in ROUTING_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query:
-                scores[specialist] += 1
-    
-    # Find highest scoring specialist
-    best_specialist = max(scores, key=scores.get)
+    scores = [0] * len(SPECIALIST_NAMES)
+    for specialist_ids in matched:
+        for i in specialist_ids:
+            scores[i] += 1
+    
+    # Find highest scoring specialist (first one wins ties)
+    best_idx = 0
+    best_score = scores[0]
+    for i in range(1, len(scores)):
+        score = scores[i]
+        if score > best_score:
+            best_idx = i
+            best_score = score
     
     # Default to research if no matches
-    if scores[best_specialist] == 0:
+    if best_score == 0:
         return "research"
     
-    return best_specialist
+    return SPECIALIST_NAMES[best_idx]
+
+
+def route_to_specialist(state: AgentState) -> Literal["code", "research", "system", "security"]:
+    """
+    Route user query to the appropriate specialist agent.
+    
+    Uses keyword matching for fast routing. Can be enhanced with
+    semantic routing via embeddings in the future.
+    """
+    return _route_cached(_query_lower(state))
+
+
+def routing_cache_info():
+    """Hit/miss statistics of the routing memo (shown by /routes)."""
+    return _route_cached.cache_info()
+
+
+def _query_lower(state: AgentState) -> str:
+    """Lowercased user query, computed once per state."""
+    query_lower = state.get("user_query_lower")
+    if query_lower is None:
+        query_lower = state["user_query_lower"] = state["user_query"].lower()
+    return query_lower
+
+
+def _mentions_dangerous(text_lower: str) -> bool:
+    """Whether already-lowercased text contains a dangerous operation."""
+    return _DANGEROUS_RE.search(text_lower) is not None
 
 
 def check_requires_approval(query: str, operation: str) -> bool:
     """Check if an operation requires human approval."""
-    combined = f"{query} {operation}".lower()
-    
-    for dangerous_word in DANGEROUS_OPERATIONS:
-        if dangerous_word in combined:
-            return True
-    
-    return False
+    return _mentions_dangerous(f"{query} {operation}".lower())
+
+
+# Per-specialist description prefix for pending actions
+ACTION_LABELS = {
+    "code": "Code Agent analyzing",
+    "research": "Research Agent looking up",
+    "system": "System Agent preparing",
+    "security": "Security Agent analyzing",
+}
+
+
+def _make_action(agent: str, operation: str, query: str) -> Dict[str, Any]:
+    """Build a specialist's pending action from its ACTION_LABELS entry."""
+    return {
+        "agent": agent,
+        "operation": operation,
+        "description": f"{ACTION_LABELS[agent]}: {query[:100]}",
+    }
 
 
 def code_agent(state: AgentState) -> AgentState:
@@ -88,17 +184,13 @@ def code_agent(state: AgentState) -> AgentState:
     
     # Determine if operation is dangerous
     operation = "analyze code"  # Default
-    if any(kw in state["user_query"].lower() for kw in ["write", "modify", "refactor", "fix"]):
+    if _CODE_MODIFY_RE.search(_query_lower(state)):
         operation = "modify code"
         state["requires_approval"] = True
     else:
         state["requires_approval"] = False
     
-    state["pending_action"] = {
-        "agent": "code",
-        "operation": operation,
-        "description": f"Code Agent analyzing: {state['user_query'][:100]}",
-    }
+    state["pending_action"] = _make_action("code", operation, state["user_query"])
     
     return state
 
@@ -112,11 +204,7 @@ def research_agent(state: AgentState) -> AgentState:
     state["current_agent"] = "research"
     state["requires_approval"] = False  # Research is safe
     
-    state["pending_action"] = {
-        "agent": "research",
-        "operation": "search and retrieve",
-        "description": f"Research Agent looking up: {state['user_query'][:100]}",
-    }
+    state["pending_action"] = _make_action("research", "search and retrieve", state["user_query"])
     
     return state
 
@@ -131,15 +219,13 @@ def system_agent(state: AgentState) -> AgentState:
     
     # System operations often require approval
     operation = "system operation"
-    requires_approval = check_requires_approval(state["user_query"], operation)
+    # Operation names are already lowercase
+    requires_approval = _mentions_dangerous(f"{_query_lower(state)} {operation}")
     
     state["requires_approval"] = requires_approval
-    state["pending_action"] = {
-        "agent": "system",
-        "operation": operation,
-        "description": f"System Agent preparing: {state['user_query'][:100]}",
-        "is_dangerous": requires_approval,
-    }
+    action = _make_action("system", operation, state["user_query"])
+    action["is_dangerous"] = requires_approval
+    state["pending_action"] = action
     
     return state
 
@@ -154,14 +240,10 @@ def security_agent(state: AgentState) -> AgentState:
     
     # Security scans are generally safe, modifications are not
     operation = "security scan"
-    requires_approval = any(kw in state["user_query"].lower() for kw in ["fix", "patch", "modify", "change"])
+    requires_approval = _SECURITY_APPROVAL_RE.search(_query_lower(state)) is not None
     
     state["requires_approval"] = requires_approval
-    state["pending_action"] = {
-        "agent": "security",
-        "operation": operation,
-        "description": f"Security Agent analyzing: {state['user_query'][:100]}",
-    }
+    state["pending_action"] = _make_action("security", operation, state["user_query"])
     
     return state
 
@@ -224,10 +306,14 @@ class SimpleOrchestrator:
     
     This is a lightweight implementation that works without LangGraph.
     Can be upgraded to full LangGraph StateGraph for production.
+    
+    With semantic_routing, paraphrases of earlier queries reuse their
+    specialist via an embedding cache (needs hnswlib and fastembed).
     """
     
-    def __init__(self):
+    def __init__(self, semantic_routing: bool = False):
         self.agents = AGENT_NODES
+        self._semantic = SemanticRouteCache() if semantic_routing else None
     
     def process_query(self, query: str) -> Dict[str, Any]:
         """
@@ -236,10 +322,31 @@ class SimpleOrchestrator:
         Returns:
             Dict with agent, requires_approval, pending_action, response
         """
+        vector = self._semantic.embed(query) if self._semantic is not None else None
+        return self._run(query, vector)
+    
+    async def aprocess_query(self, query: str) -> Dict[str, Any]:
+        """
+        process_query() for async callers.
+        
+        Concurrent queries share batched embedding calls instead of each
+        blocking the event loop on the model.
+        """
+        vector = await self._semantic.aembed(query) if self._semantic is not None else None
+        return self._run(query, vector)
+    
+    async def close(self) -> None:
+        """Stop background work started by aprocess_query()."""
+        if self._semantic is not None:
+            await self._semantic.close()
+    
+    def _run(self, query: str, vector: Optional[List[float]]) -> Dict[str, Any]:
+        """Route and run a query, given its embedding when semantic routing is on."""
         # Initialize state
         state: AgentState = {
             "messages": [],
             "user_query": query,
+            "user_query_lower": query.lower(),
             "current_agent": "",
             "specialist_response": "",
             "requires_approval": False,
@@ -247,8 +354,15 @@ class SimpleOrchestrator:
             "pending_action": {},
         }
         
-        # Route to specialist
-        specialist = route_to_specialist(state)
+        # Route to specialist, trying the semantic cache first
+        specialist = None
+        if vector is not None:
+            specialist = self._semantic.lookup(vector)
+        
+        if specialist is None:
+            specialist = route_to_specialist(state)
+            if vector is not None:
+                self._semantic.add(vector, specialist)
         
         # Run specialist agent
         agent_fn = self.agents.get(specialist, research_agent)
@@ -1,14 +1,20 @@
 """Self-development agent for OrA to work on its own codebase."""
 
 import os
-import json
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class CodeChange:
     """A proposed code change."""
     file_path: str
@@ -20,6 +26,39 @@ class CodeChange:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# Markers that make a file show up in improvement suggestions
+_TODO_RE = re.compile(r"TODO|FIXME")
+
+# Backups copy this many files at once; small files are latency-bound
+BACKUP_COPY_WORKERS = 8
+
+# Linux ioctl that makes dst a copy-on-write clone of src (Btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Copy a file as a copy-on-write clone where supported, else byte-wise."""
+    try:
+        import fcntl
+        
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=1024)
+def _relative_to_root(root: Path, resolved: Path) -> Optional[str]:
+    """resolved as a path string relative to root, or None if outside it."""
+    try:
+        return str(resolved.relative_to(root))
+    except ValueError:
+        return None
+
+
 class SelfDevelopmentAgent:
     """
     Agent that allows OrA to work on its own codebase.
@@ -51,6 +90,10 @@ class SelfDevelopmentAgent:
     ]
     
     def __init__(self):
+        # ORA_ROOT is resolved once; each checked path is still resolved per
+        # call so a symlink changed since the last check is followed
+        self._ora_root_resolved = self.ORA_ROOT.resolve()
+        self._allowed_prefixes = tuple(self.ALLOWED_PATHS)
         self.pending_changes: List[CodeChange] = []
         self.history: List[Dict[str, Any]] = []
         self._load_history()
@@ -59,50 +102,63 @@ class SelfDevelopmentAgent:
         """Load development history from disk."""
         if self.HISTORY_FILE.exists():
             try:
-                with open(self.HISTORY_FILE, "r") as f:
-                    self.history = json.load(f)
+                self.history = orjson.loads(self.HISTORY_FILE.read_bytes())
             except Exception:
                 self.history = []
     
     def _save_history(self) -> None:
         """Save development history to disk."""
         try:
-            with open(self.HISTORY_FILE, "w") as f:
-                json.dump(self.history[-100:], f, indent=2)  # Keep last 100
+            data = orjson.dumps(self.history[-100:], option=orjson.OPT_INDENT_2)  # Keep last 100
+            # Write beside the file and swap it in, so a crash mid-write
+            # can't leave a truncated history behind
+            tmp = self.HISTORY_FILE.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, self.HISTORY_FILE)
         except Exception:
             pass
     
     def _is_safe_path(self, path: str) -> bool:
         """Check if path is within allowed directories."""
         try:
-            resolved = Path(path).resolve()
-            ora_root = self.ORA_ROOT.resolve()
-            relative = resolved.relative_to(ora_root)
-            
-            # Check if in allowed paths
-            rel_str = str(relative)
-            return any(rel_str.startswith(allowed) for allowed in self.ALLOWED_PATHS)
-        except (ValueError, Exception):
+            rel_str = _relative_to_root(self._ora_root_resolved, Path(path).resolve())
+        except Exception:
+            return False
+        if rel_str is None:
             return False
+        
+        # Check if in allowed paths
+        return rel_str.startswith(self._allowed_prefixes)
     
     def _is_protected(self, path: str) -> bool:
         """Check if file is protected."""
         try:
-            resolved = Path(path).resolve()
-            ora_root = self.ORA_ROOT.resolve()
-            relative = resolved.relative_to(ora_root)
-            rel_str = str(relative)
-            return any(prot in rel_str for prot in self.PROTECTED_FILES)
+            rel_str = _relative_to_root(self._ora_root_resolved, Path(path).resolve())
         except Exception:
             return True  # If unsure, protect it
+        if rel_str is None:
+            return True
+        return any(prot in rel_str for prot in self.PROTECTED_FILES)
+    
+    def _source_files(self, pattern: str = "*.py") -> Iterator[str]:
+        """
+        Yield paths, relative to SOURCE_DIR, of files matching pattern.
+        
+        __pycache__ directories are pruned from the walk rather than
+        listed and filtered out afterwards.
+        """
+        root = str(self.SOURCE_DIR)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if "__pycache__" not in d]
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in filenames:
+                if fnmatchcase(name, pattern) and "__pycache__" not in name:
+                    yield name if rel_dir == "." else os.path.join(rel_dir, name)
     
     def list_source_files(self, pattern: str = "*.py") -> List[str]:
         """List all Python source files in OrA."""
-        files = []
-        for path in self.SOURCE_DIR.rglob(pattern):
-            if "__pycache__" not in str(path):
-                files.append(str(path.relative_to(self.ORA_ROOT)))
-        return sorted(files)
+        source_rel = self.SOURCE_DIR.relative_to(self.ORA_ROOT)
+        return sorted(str(source_rel / path) for path in self._source_files(pattern))
     
     def read_file(self, relative_path: str) -> Optional[str]:
         """Read a file from OrA codebase."""
@@ -120,8 +176,36 @@ class SelfDevelopmentAgent:
         except Exception as e:
             return f"[ERROR] Could not read file: {e}"
     
-    def analyze_codebase(self) -> Dict[str, Any]:
-        """Analyze OrA's codebase structure."""
+    def _walk_codebase(self) -> Iterator[Tuple[str, Optional[str], int]]:
+        """
+        Yield (path relative to SOURCE_DIR, content, line count) for each
+        source file, read once.
+        
+        content is None (and the count 0) when the file can't be read.
+        """
+        for rel_path in self._source_files():
+            try:
+                with open(os.path.join(self.SOURCE_DIR, rel_path), "r") as f:
+                    content = f.read()
+            except Exception:
+                yield rel_path, None, 0
+                continue
+            
+            # Same count readlines() gave: a final line without "\n" counts too
+            lines = content.count("\n")
+            if content and not content.endswith("\n"):
+                lines += 1
+            yield rel_path, content, lines
+    
+    def _scan_codebase(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Analyze the codebase and find TODO/FIXME files in one pass.
+        
+        Returns the analyze_codebase() dict and the paths (relative to
+        ORA_ROOT) of files containing TODO or FIXME.
+        """
+        todo_files = []
+        source_rel = self.SOURCE_DIR.relative_to(self.ORA_ROOT)
         analysis = {
             "modules": [],
             "total_files": 0,
@@ -134,30 +218,30 @@ class SelfDevelopmentAgent:
             },
         }
         
-        for py_file in self.SOURCE_DIR.rglob("*.py"):
-            if "__pycache__" not in str(py_file):
-                rel_path = str(py_file.relative_to(self.SOURCE_DIR))
-                analysis["total_files"] += 1
-                
-                try:
-                    with open(py_file, "r") as f:
-                        lines = len(f.readlines())
-                        analysis["total_lines"] += lines
-                except Exception:
-                    lines = 0
-                
-                # Categorize
-                if "widgets" in rel_path:
-                    analysis["components"]["widgets"].append(rel_path)
-                elif "backend" in rel_path:
-                    analysis["components"]["backend"].append(rel_path)
-                elif "orchestrator" in rel_path:
-                    analysis["components"]["orchestrator"].append(rel_path)
-                elif "memory" in rel_path:
-                    analysis["components"]["memory"].append(rel_path)
-                else:
-                    analysis["modules"].append(rel_path)
+        for rel_path, content, lines in self._walk_codebase():
+            analysis["total_files"] += 1
+            analysis["total_lines"] += lines
+            
+            # Categorize
+            if "widgets" in rel_path:
+                analysis["components"]["widgets"].append(rel_path)
+            elif "backend" in rel_path:
+                analysis["components"]["backend"].append(rel_path)
+            elif "orchestrator" in rel_path:
+                analysis["components"]["orchestrator"].append(rel_path)
+            elif "memory" in rel_path:
+                analysis["components"]["memory"].append(rel_path)
+            else:
+                analysis["modules"].append(rel_path)
+            
+            if content is not None and _TODO_RE.search(content):
+                todo_files.append(str(source_rel / rel_path))
         
+        return analysis, todo_files
+    
+    def analyze_codebase(self) -> Dict[str, Any]:
+        """Analyze OrA's codebase structure."""
+        analysis, _ = self._scan_codebase()
         return analysis
     
     def propose_change(
@@ -166,17 +250,23 @@ class SelfDevelopmentAgent:
         description: str,
         new_content: str,
         change_type: str = "modify",
+        original_content: Optional[str] = None,
     ) -> CodeChange:
-        """Propose a code change for review."""
-        full_path = self.ORA_ROOT / file_path
+        """
+        Propose a code change for review.
         
-        original = None
-        if full_path.exists() and change_type == "modify":
-            try:
-                with open(full_path, "r") as f:
-                    original = f.read()
-            except Exception:
-                pass
+        Pass original_content when the current file text is already in
+        hand (e.g. from building a diff) to skip reading it again.
+        """
+        original = original_content
+        if original is None and change_type == "modify":
+            full_path = self.ORA_ROOT / file_path
+            if full_path.exists():
+                try:
+                    with open(full_path, "r") as f:
+                        original = f.read()
+                except Exception:
+                    pass
         
         change = CodeChange(
             file_path=file_path,
@@ -243,19 +333,11 @@ class SelfDevelopmentAgent:
     
     def get_improvement_suggestions(self) -> List[str]:
         """Generate suggestions for codebase improvements."""
-        suggestions = []
-        analysis = self.analyze_codebase()
+        # TODO comments come from the same walk of the tree as the analysis
+        _, todo_files = self._scan_codebase()
         
         # Check for TODO comments
-        for py_file in self.SOURCE_DIR.rglob("*.py"):
-            if "__pycache__" not in str(py_file):
-                try:
-                    content = py_file.read_text()
-                    if "TODO" in content or "FIXME" in content:
-                        rel_path = str(py_file.relative_to(self.ORA_ROOT))
-                        suggestions.append(f"Review TODOs in {rel_path}")
-                except Exception:
-                    pass
+        suggestions = [f"Review TODOs in {rel_path}" for rel_path in todo_files]
         
         # Check for missing docstrings
         # Check for test coverage
@@ -264,10 +346,12 @@ class SelfDevelopmentAgent:
         return suggestions
     
     def create_backup(self) -> str:
-        """Create a backup of the current OrA state."""
-        import shutil
-        from datetime import datetime
+        """
+        Create a backup of the current OrA state.
         
+        Files are cloned copy-on-write where the filesystem allows it and
+        copied on BACKUP_COPY_WORKERS threads otherwise.
+        """
         backup_dir = self.ORA_ROOT / ".backups"
         backup_dir.mkdir(exist_ok=True)
         
@@ -275,11 +359,19 @@ class SelfDevelopmentAgent:
         backup_path = backup_dir / f"ora_backup_{timestamp}"
         
         try:
-            shutil.copytree(
-                self.SOURCE_DIR,
-                backup_path,
-                ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-            )
+            with ThreadPoolExecutor(max_workers=BACKUP_COPY_WORKERS) as pool:
+                copies = []
+                # copytree creates the directories; the file copies run on the pool
+                shutil.copytree(
+                    self.SOURCE_DIR,
+                    backup_path,
+                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+                    copy_function=lambda src, dst: copies.append(
+                        pool.submit(_clone_file, src, dst)
+                    ),
+                )
+                for copy in copies:
+                    copy.result()
             return str(backup_path)
         except Exception as e:
             return f"Backup failed: {e}"
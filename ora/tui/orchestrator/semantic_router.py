@@ -0,0 +1,144 @@
+"""Embedding-keyed cache of routing decisions.
+
+Paraphrases of an earlier query ("delete old files" / "remove stale files")
+reuse its specialist instead of going through keyword routing.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from ora.orchestrator.embed import EmbeddingBatcher
+
+
+# all-MiniLM-L6-v2 vector size, minimum cosine similarity for a hit,
+# entries kept before the least recently used is evicted, and seconds
+# before an entry goes stale
+SEMANTIC_ROUTE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_ROUTE_DIM = 384
+SEMANTIC_ROUTE_THRESHOLD = 0.92
+SEMANTIC_ROUTE_MAX = 4096
+SEMANTIC_ROUTE_TTL = 3600.0
+
+
+class SemanticRouteCache:
+    """
+    In-memory HNSW index from query embeddings to the specialist chosen.
+
+    Needs the optional hnswlib and fastembed packages; without them (or
+    if the embedding model can't be loaded) is_available is False and the
+    orchestrator routes by keywords alone.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_ROUTE_THRESHOLD,
+        max_entries: int = SEMANTIC_ROUTE_MAX,
+        ttl: float = SEMANTIC_ROUTE_TTL,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._index = None
+        self._embedder = None
+        self._batcher: Optional[EmbeddingBatcher] = None
+        self._checked = False
+        # Label -> (specialist, monotonic time stored), least recently used first
+        self._entries: OrderedDict[int, tuple[str, float]] = OrderedDict()
+        self._next_label = 0
+
+    def _ensure_initialized(self) -> bool:
+        """Load the embedding model and build the index on first use."""
+        if self._checked:
+            return self._index is not None
+        self._checked = True
+
+        try:
+            import hnswlib
+            from fastembed import TextEmbedding
+
+            index = hnswlib.Index(space="cosine", dim=SEMANTIC_ROUTE_DIM)
+            index.init_index(
+                max_elements=self.max_entries,
+                M=16,
+                ef_construction=100,
+                allow_replace_deleted=True,
+            )
+            self._embedder = TextEmbedding(SEMANTIC_ROUTE_MODEL)
+            self._index = index
+            return True
+        except Exception:
+            # hnswlib/fastembed missing or model unavailable - cache disabled
+            return False
+
+    def embed(self, query: str) -> Optional[List[float]]:
+        """Embed a query, or None when the cache is unavailable."""
+        if not self._ensure_initialized():
+            return None
+
+        try:
+            return next(iter(self._embedder.embed([query])))
+        except Exception:
+            return None
+
+    async def aembed(self, query: str) -> Optional[List[float]]:
+        """
+        embed() for async callers, batched with other concurrent requests.
+
+        The first call loads the model in a worker thread.
+        """
+        if not self._checked:
+            await asyncio.to_thread(self._ensure_initialized)
+        if self._index is None:
+            return None
+
+        if self._batcher is None:
+            self._batcher = EmbeddingBatcher(self._embedder.embed)
+        try:
+            return await self._batcher.embed(query)
+        except Exception:
+            return None
+
+    async def close(self) -> None:
+        """Stop the embedding batcher, if aembed() started one."""
+        if self._batcher is not None:
+            await self._batcher.close()
+
+    def lookup(self, vector: List[float]) -> Optional[str]:
+        """Specialist chosen for the nearest earlier query, if close enough."""
+        if not self._entries:
+            return None
+
+        labels, distances = self._index.knn_query(vector, k=1)
+        label = int(labels[0][0])
+        if 1.0 - distances[0][0] < self.threshold:
+            return None
+
+        specialist, stored = self._entries[label]
+        if time.monotonic() - stored > self.ttl:
+            self._evict(label)
+            return None
+
+        self._entries.move_to_end(label)
+        return specialist
+
+    def add(self, vector: List[float], specialist: str) -> None:
+        """Remember the specialist chosen for a query embedding."""
+        if len(self._entries) >= self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+        label = self._next_label
+        self._next_label += 1
+        self._index.add_items([vector], [label], replace_deleted=True)
+        self._entries[label] = (specialist, time.monotonic())
+
+    def _evict(self, label: int) -> None:
+        """Drop one entry; its index slot is reused by the next add()."""
+        del self._entries[label]
+        self._index.mark_deleted(label)
+
+    @property
+    def is_available(self) -> bool:
+        """Check if semantic routing can be used."""
+        return self._ensure_initialized()
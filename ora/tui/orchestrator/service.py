@@ -2,12 +2,19 @@
 
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
-import uuid
+import itertools
+import secrets
 
 from ora.orchestrator.graph import SimpleOrchestrator, AgentState
 
 
-@dataclass
+# Approval ids: a random per-process prefix plus a counter, so ids from a
+# previous run don't collide with new ones and each id costs no syscall
+_ID_PREFIX = secrets.token_hex(2)
+_ID_COUNTER = itertools.count()
+
+
+@dataclass(slots=True)
 class PendingApproval:
     """A pending action awaiting human approval."""
     id: str
@@ -33,8 +40,8 @@ class OrchestratorService:
             service.approve(approval_id)
     """
     
-    def __init__(self):
-        self.orchestrator = SimpleOrchestrator()
+    def __init__(self, semantic_routing: bool = False):
+        self.orchestrator = SimpleOrchestrator(semantic_routing=semantic_routing)
         self.pending_approvals: Dict[str, PendingApproval] = {}
     
     def process_query(self, query: str) -> Dict[str, Any]:
@@ -48,11 +55,21 @@ class OrchestratorService:
             - approval_id: ID to use for approval (if required)
             - pending_action: Details about the pending action
         """
-        result = self.orchestrator.process_query(query)
-        
+        return self._register(query, self.orchestrator.process_query(query))
+    
+    async def aprocess_query(self, query: str) -> Dict[str, Any]:
+        """process_query() for async callers; semantic routing embeds in batches."""
+        return self._register(query, await self.orchestrator.aprocess_query(query))
+    
+    async def close(self) -> None:
+        """Stop the orchestrator's background work."""
+        await self.orchestrator.close()
+    
+    def _register(self, query: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a pending approval for results that need one."""
         if result["requires_approval"]:
             # Create pending approval
-            approval_id = str(uuid.uuid4())[:8]
+            approval_id = f"{_ID_PREFIX}{next(_ID_COUNTER):04x}"
             
             pending = PendingApproval(
                 id=approval_id,
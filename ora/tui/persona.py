@@ -5,7 +5,7 @@ import time
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrAResponse:
     text: str
     timestamp: float
@@ -45,19 +45,32 @@ class OrAPersona:
         ],
     }
 
+    # Normalized input -> RESPONSES key
+    COMMANDS = {
+        "help": "help", "?": "help", "/help": "help",
+        "status": "status", "/status": "status", "sys": "status", "system": "status",
+    }
+
     def __init__(self, user_name: str = "Randall") -> None:
         self.user_name = user_name
+        # Every reply with the user's name filled in, formatted once. The
+        # calls themselves aren't memoized: replies are picked at random
+        # and timestamped per call
+        self._greetings = [g.format(name=user_name) for g in self.GREETINGS]
+        self._defaults = [d.format(name=user_name) for d in self.RESPONSES["default"]]
+        self._command_texts = {
+            "help": self.RESPONSES["help"].format(name=user_name),
+            "status": self.RESPONSES["status"],
+        }
 
     def greeting(self) -> OrAResponse:
-        text = random.choice(self.GREETINGS).format(name=self.user_name)
+        text = random.choice(self._greetings)
         return OrAResponse(text=text, timestamp=time.time())
 
     def respond(self, user_input: str) -> OrAResponse:
-        lower = user_input.strip().lower()
-        if lower in ("help", "?", "/help"):
-            text = self.RESPONSES["help"].format(name=self.user_name)
-        elif lower in ("status", "/status", "sys", "system"):
-            text = self.RESPONSES["status"]
+        key = self.COMMANDS.get(user_input.strip().lower())
+        if key is not None:
+            text = self._command_texts[key]
         else:
-            text = random.choice(self.RESPONSES["default"]).format(name=self.user_name)
+            text = random.choice(self._defaults)
         return OrAResponse(text=text, timestamp=time.time())
@@ -11,7 +11,6 @@ from tui.widgets.monitor_panel import MonitorPanel
 from tui.widgets.task_panel import TaskPanel
 from tui.widgets.status_bar import StatusBar
 from tui.widgets.approval_panel import ApprovalPanel
-from tui.orchestrator.service import OrchestratorService
 
 
 class MainScreen(Screen):
@@ -20,7 +19,17 @@ class MainScreen(Screen):
     def __init__(self, config: OrAConfig) -> None:
         super().__init__()
         self.config = config
-        self.orchestrator = OrchestratorService()
+        self._orchestrator = None
+
+    @property
+    def orchestrator(self):
+        """Orchestrator service, imported and built on first use so startup skips it."""
+        if self._orchestrator is None:
+            from tui.orchestrator.service import OrchestratorService
+            self._orchestrator = OrchestratorService(
+                semantic_routing=self.config.semantic_routing
+            )
+        return self._orchestrator
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -40,6 +49,11 @@ class MainScreen(Screen):
         except Exception:
             pass
 
+    async def on_unmount(self) -> None:
+        # Only an orchestrator that was actually built has anything to stop
+        if self._orchestrator is not None:
+            await self._orchestrator.close()
+
     def on_approval_panel_approved(self, event: ApprovalPanel.Approved) -> None:
         result = self.orchestrator.approve(event.approval_id)
         chat = self.query_one("#chat-panel", ChatPanel)
@@ -1,10 +1,22 @@
 """Real system stats via psutil."""
 
-import psutil
+import time
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 
-@dataclass
+# Disk usage moves slowly, so it is re-read at most this often (seconds)
+DISK_STATS_TTL = 5.0
+
+_GB = 1024**3
+
+# (monotonic time read, (used GB, total GB, percent)) of the last disk read
+_disk_cache: Optional[Tuple[float, Tuple[float, float, float]]] = None
+_cpu_count: Optional[int] = None
+_psutil = None
+
+
+@dataclass(slots=True)
 class SystemStats:
     cpu_percent: float
     ram_used_gb: float
@@ -16,17 +28,44 @@ class SystemStats:
     cpu_count: int
 
 
+def _get_psutil():
+    """psutil, imported on first use so it stays off the startup path."""
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+
+def _disk_stats() -> Tuple[float, float, float]:
+    """Root filesystem (used GB, total GB, percent), cached for DISK_STATS_TTL."""
+    global _disk_cache
+    now = time.monotonic()
+    if _disk_cache is None or now - _disk_cache[0] > DISK_STATS_TTL:
+        disk = _get_psutil().disk_usage("/")
+        _disk_cache = (now, (
+            round(disk.used / _GB, 0),
+            round(disk.total / _GB, 0),
+            round(disk.percent, 1),
+        ))
+    return _disk_cache[1]
+
+
 def get_system_stats() -> SystemStats:
     """Collect current system statistics. Non-blocking."""
+    global _cpu_count
+    psutil = _get_psutil()
+    if _cpu_count is None:
+        _cpu_count = psutil.cpu_count() or 1
     mem = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
+    disk_used, disk_total, disk_percent = _disk_stats()
     return SystemStats(
         cpu_percent=psutil.cpu_percent(interval=None),
-        ram_used_gb=round(mem.used / (1024**3), 1),
-        ram_total_gb=round(mem.total / (1024**3), 1),
+        ram_used_gb=round(mem.used / _GB, 1),
+        ram_total_gb=round(mem.total / _GB, 1),
         ram_percent=mem.percent,
-        disk_used_gb=round(disk.used / (1024**3), 0),
-        disk_total_gb=round(disk.total / (1024**3), 0),
-        disk_percent=round(disk.percent, 1),
-        cpu_count=psutil.cpu_count() or 1,
+        disk_used_gb=disk_used,
+        disk_total_gb=disk_total,
+        disk_percent=disk_percent,
+        cpu_count=_cpu_count,
     )
@@ -6,6 +6,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Progress a running mock task gains per tick: uniform in [STEP, STEP + SPREAD)
+PROGRESS_STEP = 0.01
+PROGRESS_SPREAD = 0.03
+
+
 class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -27,6 +32,8 @@ class TaskManager:
     """Mock task manager. Phase 2 replaces with real async task queue."""
 
     def __init__(self) -> None:
+        # Set whenever a task changes; cleared by whoever renders the tasks
+        self.dirty = True
         self.tasks: list[MockTask] = [
             MockTask(
                 id="scan-downloads",
@@ -56,8 +63,10 @@ class TaskManager:
 
     def tick(self) -> None:
         """Advance mock task progress. Called on timer."""
+        rand = random.random
         for task in self.tasks:
             if task.status == TaskStatus.RUNNING:
-                task.progress = min(1.0, task.progress + random.uniform(0.01, 0.04))
+                self.dirty = True
+                task.progress = min(1.0, task.progress + PROGRESS_STEP + PROGRESS_SPREAD * rand())
                 if task.progress >= 1.0:
                     task.status = TaskStatus.COMPLETED
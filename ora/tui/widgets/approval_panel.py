@@ -8,6 +8,10 @@ from textual.message import Message
 from typing import Optional
 
 
+# Description shown for a pending action: agent, operation, details
+_APPROVAL_FMT = "[bold cyan]%s[/] agent wants to:\n\n[bold]%s[/]\n\n%s"
+
+
 class ApprovalPanel(Widget):
     """
     Big green/red button approval UI for dangerous operations.
@@ -84,6 +88,7 @@ class ApprovalPanel(Widget):
     
     def on_mount(self) -> None:
         """Start hidden until there's something to approve."""
+        self._description = self.query_one("#approval-description", Static)
         self.add_class("hidden")
     
     def show_approval(
@@ -98,12 +103,7 @@ class ApprovalPanel(Widget):
         self.pending_agent = agent
         self.pending_action = operation
         
-        desc_widget = self.query_one("#approval-description", Static)
-        desc_widget.update(
-            f"[bold cyan]{agent.upper()}[/] agent wants to:\n\n"
-            f"[bold]{operation}[/]\n\n"
-            f"{description}"
-        )
+        self._description.update(_APPROVAL_FMT % (agent.upper(), operation, description))
         
         self.remove_class("hidden")
     
@@ -112,8 +112,7 @@ class ApprovalPanel(Widget):
         self.pending_approval_id = None
         self.add_class("hidden")
         
-        desc_widget = self.query_one("#approval-description", Static)
-        desc_widget.update("No pending actions")
+        self._description.update("No pending actions")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle approve/reject button clicks."""
@@ -124,8 +123,7 @@ class ApprovalPanel(Widget):
         
         if event.button.id == "btn-approve":
             # Show approval feedback
-            desc_widget = self.query_one("#approval-description", Static)
-            desc_widget.update("[green]✓ Action approved. Executing...[/]")
+            self._description.update("[green]✓ Action approved. Executing...[/]")
             
             # Post approval message
             self.post_message(self.Approved(approval_id))
@@ -135,8 +133,7 @@ class ApprovalPanel(Widget):
             
         elif event.button.id == "btn-reject":
             # Show rejection feedback
-            desc_widget = self.query_one("#approval-description", Static)
-            desc_widget.update("[red]✗ Action rejected.[/]")
+            self._description.update("[red]✗ Action rejected.[/]")
             
             # Post rejection message
             self.post_message(self.Rejected(approval_id))
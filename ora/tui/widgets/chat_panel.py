@@ -1,7 +1,6 @@
 """Chat panel — main interaction with OrA."""
 
 import asyncio
-import re
 from textual.app import ComposeResult
 from textual.widgets import Input, RichLog
 from textual.widget import Widget
@@ -12,7 +11,73 @@ from ora.persona import OrAPersona
 from ora.backend.litellm_backend import LiteLLMBackend
 
 
-_THINK_RE = re.compile(r'<think>.*?</think>\s*', flags=re.DOTALL)
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+def _partial_tag_start(text: str, tag: str) -> int:
+    """Index where a trailing prefix of tag starts in text, else len(text)."""
+    start = text.rfind("<", max(0, len(text) - len(tag) + 1))
+    if start >= 0 and tag.startswith(text[start:]):
+        return start
+    return len(text)
+
+
+class _ThinkFilter:
+    """
+    Drop <think>...</think> blocks (and the whitespace after them) from
+    streamed text as it arrives.
+
+    Only a trailing partial tag ("<thi") is held back between chunks, so
+    a tag split across chunks is still seen and chunks without "<" are
+    appended as they are. A block that is never closed is kept verbatim,
+    as the old whole-response regex did.
+    """
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self._pending = ""
+        self._think: list[str] = []
+        self._in_think = False
+        self._skip_space = False
+
+    def feed(self, chunk: str) -> None:
+        if not self._pending and not self._skip_space and "<" not in chunk:
+            (self._think if self._in_think else self.parts).append(chunk)
+            return
+
+        text = self._pending + chunk
+        while True:
+            if self._skip_space:
+                stripped = text.lstrip()
+                if not stripped:
+                    self._pending = ""
+                    return
+                self._skip_space = False
+                text = stripped
+
+            tag = _THINK_CLOSE if self._in_think else _THINK_OPEN
+            found = text.find(tag)
+            if found < 0:
+                cut = _partial_tag_start(text, tag)
+                (self._think if self._in_think else self.parts).append(text[:cut])
+                self._pending = text[cut:]
+                return
+
+            if self._in_think:
+                self._think.clear()
+                self._skip_space = True
+            else:
+                self.parts.append(text[:found])
+            self._in_think = not self._in_think
+            text = text[found + len(tag):]
+
+    def text(self) -> str:
+        """Everything fed so far outside think blocks."""
+        if self._in_think:
+            # Unclosed block: nothing to strip
+            return "".join(self.parts) + _THINK_OPEN + "".join(self._think) + self._pending
+        return "".join(self.parts) + ("" if self._skip_space else self._pending)
 
 
 class ChatPanel(Widget):
@@ -37,89 +102,103 @@ class ChatPanel(Widget):
         yield Input(placeholder="Talk to OrA... (/help for commands)", id="chat-input")
 
     def on_mount(self) -> None:
+        self._log = self.query_one("#chat-log", RichLog)
+        self._input = self.query_one("#chat-input", Input)
         greeting = self.persona.greeting()
-        log = self.query_one("#chat-log", RichLog)
-        log.write(f"[bold magenta]OrA[/] [dim]›[/] {greeting.text}")
-        log.write("")
+        self._write_block(f"[bold magenta]OrA[/] [dim]›[/] {greeting.text}")
+
+    def _write_block(self, *lines: str) -> None:
+        """Write lines plus a blank separator line to the log in one write."""
+        self._log.write("\n".join(lines) + "\n")
 
     def _handle_slash_command(self, cmd: str) -> bool:
         """Handle /commands. Returns True if handled."""
-        log = self.query_one("#chat-log", RichLog)
         parts = cmd.strip().split(None, 1)
         command = parts[0].lower()
 
+        # Each command's output goes to the log in a single write, so the
+        # log re-renders once per command
         if command in ("/help", "/?"):
-            log.write("[bold cyan]Commands:[/]")
-            log.write("  [cyan]/help[/]    — show this")
-            log.write("  [cyan]/clear[/]   — clear chat")
-            log.write("  [cyan]/model[/]   — show current model")
-            log.write("  [cyan]/memory[/]  — show memory status")
-            log.write("  [cyan]/status[/]  — system overview")
-            log.write("  [cyan]/reset[/]   — clear conversation history")
-            log.write("")
-            return True
-
-        if command == "/clear":
-            log.clear()
-            log.write("[dim]Chat cleared.[/]")
-            log.write("")
-            return True
-
-        if command == "/model":
-            log.write(f"[bold cyan]Model:[/] {self.backend.model}")
+            lines = [
+                "[bold cyan]Commands:[/]",
+                "  [cyan]/help[/]    — show this",
+                "  [cyan]/clear[/]   — clear chat",
+                "  [cyan]/model[/]   — show current model",
+                "  [cyan]/memory[/]  — show memory status",
+                "  [cyan]/status[/]  — system overview",
+                "  [cyan]/reset[/]   — clear conversation history",
+                "  [cyan]/routes[/]  — routing cache stats",
+            ]
+
+        elif command == "/clear":
+            self._log.clear()
+            lines = ["[dim]Chat cleared.[/]"]
+
+        elif command == "/model":
             mem = "available" if self.backend.memory_available else "offline"
-            log.write(f"[bold cyan]Memory:[/] {mem}")
-            log.write("")
-            return True
+            lines = [
+                f"[bold cyan]Model:[/] {self.backend.model}",
+                f"[bold cyan]Memory:[/] {mem}",
+            ]
 
-        if command == "/memory":
+        elif command == "/memory":
             if self.backend.memory_available:
-                log.write("[bold green]Memory:[/] Qdrant connected")
+                lines = ["[bold green]Memory:[/] Qdrant connected"]
             else:
-                log.write("[bold yellow]Memory:[/] Qdrant offline — session only")
-            log.write("")
-            return True
-
-        if command == "/status":
-            from ora.system_monitor import get_system_stats
-            stats = get_system_stats()
-            log.write(f"[bold cyan]CPU:[/]  {stats.cpu_percent:.0f}% ({stats.cpu_count} cores)")
-            log.write(f"[bold cyan]RAM:[/]  {stats.ram_used_gb}G / {stats.ram_total_gb}G ({stats.ram_percent:.0f}%)")
-            log.write(f"[bold cyan]Disk:[/] {stats.disk_used_gb:.0f}G / {stats.disk_total_gb:.0f}G ({stats.disk_percent:.0f}%)")
-            log.write("")
-            return True
-
-        if command == "/reset":
+                lines = ["[bold yellow]Memory:[/] Qdrant offline — session only"]
+
+        elif command == "/status":
+            stats = self.app.system_stats()
+            lines = [
+                f"[bold cyan]CPU:[/]  {stats.cpu_percent:.0f}% ({stats.cpu_count} cores)",
+                f"[bold cyan]RAM:[/]  {stats.ram_used_gb}G / {stats.ram_total_gb}G ({stats.ram_percent:.0f}%)",
+                f"[bold cyan]Disk:[/] {stats.disk_used_gb:.0f}G / {stats.disk_total_gb:.0f}G ({stats.disk_percent:.0f}%)",
+            ]
+
+        elif command == "/reset":
             self.backend.clear_history()
-            log.write("[dim]Conversation history cleared.[/]")
-            log.write("")
-            return True
+            lines = ["[dim]Conversation history cleared.[/]"]
+
+        elif command == "/routes":
+            # Imported here so startup doesn't load the orchestrator package
+            from ora.orchestrator.graph import routing_cache_info
+            info = routing_cache_info()
+            lines = [
+                f"[bold cyan]Routing cache:[/] {info.hits} hits, {info.misses} misses, "
+                f"{info.currsize}/{info.maxsize} entries"
+            ]
+
+        else:
+            return False
 
-        return False
+        self._write_block(*lines)
+        return True
 
     async def _stream_response(self, user_text: str) -> None:
-        """Stream LLM response to chat log."""
-        log = self.query_one("#chat-log", RichLog)
+        """
+        Stream LLM response to chat log.
 
+        Chunks are filtered into a list and joined once; the reply is
+        written in one piece when the stream ends, so there are no
+        per-chunk redraws to coalesce.
+        """
         try:
-            full_response = ""
+            response = _ThinkFilter()
             async for chunk in self.backend.stream_message(user_text):
-                full_response += chunk
+                response.feed(chunk)
 
-            display = _THINK_RE.sub('', full_response).strip()
+            display = response.text().strip()
 
             if display:
-                log.write(f"[bold magenta]OrA[/] [dim]›[/] {display}")
+                self._write_block(f"[bold magenta]OrA[/] [dim]›[/] {display}")
             else:
-                log.write("[bold magenta]OrA[/] [dim]› (empty response)[/]")
-            log.write("")
+                self._write_block("[bold magenta]OrA[/] [dim]› (empty response)[/]")
 
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)[:120]}"
-            log.write(f"[bold red]Error[/] [dim]›[/] {error_msg}")
+            self._log.write(f"[bold red]Error[/] [dim]›[/] {error_msg}")
             response = self.persona.respond(user_text)
-            log.write(f"[bold magenta]OrA[/] [dim](offline) ›[/] {response.text}")
-            log.write("")
+            self._write_block(f"[bold magenta]OrA[/] [dim](offline) ›[/] {response.text}")
 
         self._processing = False
         self.post_message(self.ResponseComplete())
@@ -129,14 +208,12 @@ class ChatPanel(Widget):
         if not user_text or self._processing:
             return
 
-        log = self.query_one("#chat-log", RichLog)
-        input_widget = self.query_one("#chat-input", Input)
-        input_widget.value = ""
+        self._input.value = ""
 
         if user_text.startswith("/"):
             if self._handle_slash_command(user_text):
                 return
 
-        log.write(f"[bold cyan]You[/] [dim]›[/] {user_text}")
+        self._log.write(f"[bold cyan]You[/] [dim]›[/] {user_text}")
         self._processing = True
         asyncio.create_task(self._stream_response(user_text))
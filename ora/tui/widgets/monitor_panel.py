@@ -1,11 +1,19 @@
 """System monitor panel — real psutil data."""
 
+import time
+from collections import deque
+
 from textual.app import ComposeResult
 from textual.widgets import Static, ProgressBar, Label, Sparkline
 from textual.widget import Widget
 
 from ora.config import OrAConfig
-from ora.system_monitor import get_system_stats
+
+
+# Stat line templates
+_CPU_FMT = "  CPU  %5.1f%%  (%d cores)"
+_RAM_FMT = "  RAM  %sG / %sG  (%.0f%%)"
+_DSK_FMT = "  DSK  %.0fG / %.0fG  (%.1f%%)"
 
 
 class MonitorPanel(Widget):
@@ -14,7 +22,12 @@ class MonitorPanel(Widget):
     def __init__(self, config: OrAConfig, **kwargs) -> None:
         super().__init__(**kwargs)
         self.config = config
-        self._cpu_data: list[float] = []
+        self._cpu_data: deque[float] = deque(maxlen=60)
+        self._last_sample = 0.0
+        # Last values written per channel, to skip unchanged updates
+        self._last_cpu: tuple = ()
+        self._last_ram: tuple = ()
+        self._last_disk: tuple = ()
 
     def compose(self) -> ComposeResult:
         yield Label("[bold]SYSTEM MONITOR[/]", id="monitor-title")
@@ -28,31 +41,53 @@ class MonitorPanel(Widget):
         yield Sparkline([], id="cpu-sparkline")
 
     def on_mount(self) -> None:
+        # Looked up once; the panel's children never change after compose
+        self._cpu_stat = self.query_one("#cpu-stat", Static)
+        self._cpu_bar = self.query_one("#cpu-bar", ProgressBar)
+        self._ram_stat = self.query_one("#ram-stat", Static)
+        self._ram_bar = self.query_one("#ram-bar", ProgressBar)
+        self._disk_stat = self.query_one("#disk-stat", Static)
+        self._disk_bar = self.query_one("#disk-bar", ProgressBar)
+        self._sparkline = self.query_one("#cpu-sparkline", Sparkline)
+        # The sparkline renders straight from the history deque, which is
+        # mutated in place and signalled with mutate_reactive
+        self._sparkline.data = self._cpu_data
+        self._refresh_every = max(1, round(self.config.refresh_interval / self.config.tick_interval))
         self._refresh_stats()
-        self.set_interval(self.config.refresh_interval, self._refresh_stats)
+        self.app.tick_signal.subscribe(self, self._on_tick, immediate=True)
+
+    def _on_tick(self, tick: int) -> None:
+        if tick % self._refresh_every == 0:
+            self._refresh_stats()
 
     def _refresh_stats(self) -> None:
-        stats = get_system_stats()
-
-        self.query_one("#cpu-stat", Static).update(
-            f"  CPU  {stats.cpu_percent:5.1f}%  ({stats.cpu_count} cores)"
-        )
-        cpu_bar = self.query_one("#cpu-bar", ProgressBar)
-        cpu_bar.progress = stats.cpu_percent
-
-        self.query_one("#ram-stat", Static).update(
-            f"  RAM  {stats.ram_used_gb}G / {stats.ram_total_gb}G  ({stats.ram_percent:.0f}%)"
-        )
-        ram_bar = self.query_one("#ram-bar", ProgressBar)
-        ram_bar.progress = stats.ram_percent
-
-        self.query_one("#disk-stat", Static).update(
-            f"  DSK  {stats.disk_used_gb:.0f}G / {stats.disk_total_gb:.0f}G  ({stats.disk_percent:.1f}%)"
-        )
-        disk_bar = self.query_one("#disk-bar", ProgressBar)
-        disk_bar.progress = stats.disk_percent
-
-        self._cpu_data.append(stats.cpu_percent)
-        if len(self._cpu_data) > 60:
-            self._cpu_data = self._cpu_data[-60:]
-        self.query_one("#cpu-sparkline", Sparkline).data = list(self._cpu_data)
+        stats = self.app.system_stats()
+        cpu = (stats.cpu_percent, stats.cpu_count)
+        ram = (stats.ram_used_gb, stats.ram_total_gb, stats.ram_percent)
+        disk = (stats.disk_used_gb, stats.disk_total_gb, stats.disk_percent)
+
+        # One repaint for the whole panel; channels that didn't move are skipped
+        with self.app.batch_update():
+            if cpu != self._last_cpu:
+                self._last_cpu = cpu
+                self._cpu_stat.update(_CPU_FMT % cpu)
+                self._cpu_bar.progress = stats.cpu_percent
+
+            if ram != self._last_ram:
+                self._last_ram = ram
+                self._ram_stat.update(_RAM_FMT % ram)
+                self._ram_bar.progress = stats.ram_percent
+
+            if disk != self._last_disk:
+                self._last_disk = disk
+                self._disk_stat.update(_DSK_FMT % disk)
+                self._disk_bar.progress = stats.disk_percent
+
+            # After a pause (app suspended) older samples aren't a
+            # continuous history any more, so start the sparkline over
+            now = time.monotonic()
+            if now - self._last_sample > 2 * self.config.refresh_interval:
+                self._cpu_data.clear()
+            self._last_sample = now
+            self._cpu_data.append(stats.cpu_percent)
+            self._sparkline.mutate_reactive(Sparkline.data)
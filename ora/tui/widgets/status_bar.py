@@ -19,29 +19,29 @@ class StatusBar(Widget):
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="status-row"):
-            yield Static("", id="status-model")
-            yield Static("", id="status-memory")
+            # Model, memory and rate never change; only the uptime ticks
+            yield Static(" [bold]MODEL[/] minimax-m2.1", id="status-model")
+            yield Static(" [bold]MEM[/] session", id="status-memory")
             yield Static("", id="status-session")
-            yield Static("", id="status-rate")
+            yield Static(" [bold]RPM[/] 40", id="status-rate")
 
     def on_mount(self) -> None:
+        self._status_session = self.query_one("#status-session", Static)
+        self._last_uptime: tuple[int, int] = (-1, -1)
         self._update_status()
-        self.set_interval(1.0, self._update_status)
+        self.app.tick_signal.subscribe(self, self._on_tick, immediate=True)
 
-    def _update_status(self) -> None:
-        elapsed = time.time() - self.config.session_start
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+    def _on_tick(self, tick: int) -> None:
+        self._update_status()
 
-        self.query_one("#status-model", Static).update(
-            " [bold]MODEL[/] minimax-m2.1"
-        )
-        self.query_one("#status-memory", Static).update(
-            " [bold]MEM[/] session"
-        )
-        self.query_one("#status-session", Static).update(
+    def _update_status(self) -> None:
+        elapsed = time.monotonic() - self.config.session_start
+        uptime = (int(elapsed // 60), int(elapsed % 60))
+        if uptime == self._last_uptime:
+            return
+        self._last_uptime = uptime
+
+        minutes, seconds = uptime
+        self._status_session.update(
             f" [bold]UP[/] {minutes:02d}:{seconds:02d}"
         )
-        self.query_one("#status-rate", Static).update(
-            " [bold]RPM[/] 40"
-        )
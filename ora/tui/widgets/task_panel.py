@@ -16,6 +16,14 @@ STATUS_ICONS = {
     TaskStatus.PENDING: "[dim]…[/]",
 }
 
+# Progress bar width in cells, every possible bar, and every percent label
+BAR_WIDTH = 20
+_BARS = tuple(
+    f"[green]{'█' * filled}[/][dim]{'░' * (BAR_WIDTH - filled)}[/]"
+    for filled in range(BAR_WIDTH + 1)
+)
+_PCT_STRS = tuple(f"{pct:3d}%" for pct in range(101))
+
 
 class TaskPanel(Widget):
     """Displays background task queue with animated progress bars."""
@@ -23,28 +31,48 @@ class TaskPanel(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.task_manager = TaskManager()
+        # One row per task id, and the (status, pct, filled, description)
+        # each row was last rendered with
+        self._task_widgets: dict[str, Static] = {}
+        self._last_render: dict[str, tuple] = {}
 
     def compose(self) -> ComposeResult:
         yield Label("[bold]TASK QUEUE[/]", id="task-title")
         yield VerticalScroll(id="task-list")
 
     def on_mount(self) -> None:
+        self._task_list = self.query_one("#task-list", VerticalScroll)
         self._render_tasks()
-        self.set_interval(1.0, self._tick_and_render)
+        self.app.tick_signal.subscribe(self, self._tick_and_render, immediate=True)
 
-    def _tick_and_render(self) -> None:
+    def _tick_and_render(self, tick: int) -> None:
         self.task_manager.tick()
-        self._render_tasks()
+        # Nothing running and nothing changed: the rows are already current
+        if self.task_manager.dirty:
+            self._render_tasks()
 
     def _render_tasks(self) -> None:
-        container = self.query_one("#task-list", VerticalScroll)
-        container.remove_children()
-
-        for task in self.task_manager.tasks:
-            icon = STATUS_ICONS.get(task.status, "?")
-            pct = int(task.progress * 100)
-            filled = int(task.progress * 20)
-            empty = 20 - filled
-            bar = f"[green]{'█' * filled}[/][dim]{'░' * empty}[/]"
-            line = f"  {icon}  {bar} {pct:3d}%  {task.description}"
-            container.mount(Static(line, markup=True))
+        """Update the rows whose task changed; rows are mounted once per task."""
+        self.task_manager.dirty = False
+        new_rows = []
+        with self.app.batch_update():
+            for task in self.task_manager.tasks:
+                pct = int(task.progress * 100)
+                filled = int(task.progress * BAR_WIDTH)
+                key = (task.status, pct, filled, task.description)
+                if self._last_render.get(task.id) == key:
+                    continue
+                self._last_render[task.id] = key
+
+                icon = STATUS_ICONS.get(task.status, "?")
+                line = f"  {icon}  {_BARS[filled]} {_PCT_STRS[pct]}  {task.description}"
+
+                row = self._task_widgets.get(task.id)
+                if row is None:
+                    row = self._task_widgets[task.id] = Static(line, markup=True)
+                    new_rows.append(row)
+                else:
+                    row.update(line)
+
+            if new_rows:
+                self._task_list.mount(*new_rows)